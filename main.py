@@ -11,7 +11,7 @@ import time
 import yaml
 import signal
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from src.utils.logger import TradingLogger
 from src.utils.config import config
@@ -192,11 +192,12 @@ class HybridTradingBot:
             self.console.print_warning(f"No data for {symbol}")
             return
         
-        # Add indicators
-        df = add_all_indicators(df)
-        
-        # Update indicator engine
-        self.indicator_engines[symbol].update(df)
+        # Add indicators and update engine only when the klines moved
+        # (the loop polls faster than 1m bars change)
+        indicator_engine = self.indicator_engines[symbol]
+        if indicator_engine.has_changed(df):
+            df = add_all_indicators(df)
+            indicator_engine.update(df)
         
         # Get current bar
         latest = df.iloc[-1]
@@ -429,11 +430,10 @@ class HybridTradingBot:
         4. RSI reversal: Strong reversal signal
         """
         for symbol in self.symbols:
-            if symbol not in current_prices:
+            current_price = current_prices.get(symbol)
+            if current_price is None:
                 continue
             
-            current_price = current_prices[symbol]
-            
             # Get policy config
             policy_cfg = self._get_policy_config(symbol)
             
@@ -506,16 +506,23 @@ class HybridTradingBot:
                 if cancel_reason:
                     orders_to_cancel.append((order, cancel_reason))
             
-            # Cancel orders
-            for order, reason in orders_to_cancel:
-                self._cancel_order(symbol, order, reason)
+            # Cancel orders, then drop them from pending in one pass
+            if orders_to_cancel:
+                cancelled_ids = set()
+                for order, reason in orders_to_cancel:
+                    self._cancel_order(symbol, order, reason, cancelled_ids=cancelled_ids)
+                self.pending_orders[symbol] = [
+                    order for order in self.pending_orders[symbol]
+                    if id(order) not in cancelled_ids
+                ]
             
             # Store current ATR for next iteration
             if not hasattr(self, '_last_atr_pct'):
                 self._last_atr_pct = {}
             self._last_atr_pct[symbol] = current_atr_pct
     
-    def _cancel_order(self, symbol: str, order: dict, reason: str):
+    def _cancel_order(self, symbol: str, order: dict, reason: str,
+                      cancelled_ids: Optional[set] = None):
         """
         Cancel a pending order
         
@@ -523,6 +530,8 @@ class HybridTradingBot:
             symbol: Trading pair
             order: Order dict
             reason: Cancellation reason
+            cancelled_ids: If given, record id(order) here for the caller to
+                drop in bulk instead of removing it from pending orders
         """
         try:
             order_id = order.get('order_id', 'N/A')
@@ -543,7 +552,9 @@ class HybridTradingBot:
                     self.logger.error(f"Error cancelling order {order_id}: {e}")
             
             # Remove from pending orders
-            if order in self.pending_orders[symbol]:
+            if cancelled_ids is not None:
+                cancelled_ids.add(id(order))
+            elif order in self.pending_orders[symbol]:
                 self.pending_orders[symbol].remove(order)
             
             # Log cancellation
@@ -577,19 +588,18 @@ class HybridTradingBot:
                 try:
                     current_price = float(self.exchange.get_ticker(symbol)['price'])
                     
-                    filled_orders = []
+                    still_pending = []
                     for order in self.pending_orders[symbol]:
                         # Simple fill logic
                         if order['side'] == 'BUY' and current_price <= order['price']:
                             self._fill_order(order, order['price'])
-                            filled_orders.append(order)
                         elif order['side'] == 'SELL' and current_price >= order['price']:
                             self._fill_order(order, order['price'])
-                            filled_orders.append(order)
+                        else:
+                            still_pending.append(order)
                     
-                    # Remove filled orders
-                    for order in filled_orders:
-                        self.pending_orders[symbol].remove(order)
+                    # Keep unfilled orders
+                    self.pending_orders[symbol] = still_pending
                 
                 except Exception as e:
                     self.console.print_error(f"Error checking fills for {symbol}: {e}")
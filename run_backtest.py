@@ -12,7 +12,7 @@ from pathlib import Path
 
 from src.strategies.hybrid_strategy_engine import HybridStrategyEngine
 from src.indicators.indicator_engine import IndicatorEngine
-from src.indicators.technical import add_all_indicators
+from src.indicators.technical import TechnicalIndicators, add_all_indicators
 from src.utils.logger import TradingLogger
 from src.utils.order_logger import OrderLogger
 
@@ -70,6 +70,11 @@ class HybridBacktester:
         # Add indicators
         df = add_all_indicators(df)
         
+        # IndicatorEngine EMAs are causal: compute them once over the full history
+        # so each per-bar update finds the columns instead of recomputing the prefix
+        for period in (9, 21, 50):
+            df[f'EMA_{period}'] = TechnicalIndicators.calculate_ma(df, period, 'EMA')
+        
         # Process each bar
         for i in range(50, len(df)):  # Start after warmup period
             bar_df = df.iloc[:i+1]
@@ -195,28 +200,25 @@ class HybridBacktester:
             )    
     def _check_fills(self, bar: dict):
         """Check if pending orders are filled"""
-        filled_orders = []
+        still_pending = []
+        bar_low = bar['low']
+        bar_high = bar['high']
         
         for order in self.pending_orders:
-            filled = False
-            
             # Simple fill logic: if price touches order price
+            price = order['price']
             if order['side'] == 'BUY':
-                if bar['low'] <= order['price']:
-                    filled = True
-                    fill_price = order['price']
+                filled = bar_low <= price
             else:  # SELL
-                if bar['high'] >= order['price']:
-                    filled = True
-                    fill_price = order['price']
+                filled = bar_high >= price
             
             if filled:
-                self._fill_order(order, fill_price, bar['timestamp'])
-                filled_orders.append(order)
+                self._fill_order(order, price, bar['timestamp'])
+            else:
+                still_pending.append(order)
         
-        # Remove filled orders
-        for order in filled_orders:
-            self.pending_orders.remove(order)
+        # Keep unfilled orders (single pass instead of list.remove per fill)
+        self.pending_orders = still_pending
     
     def _fill_order(self, order: dict, fill_price: float, timestamp: datetime):
         """Fill an order"""
@@ -225,9 +227,11 @@ class HybridBacktester:
         order_value = equity * 0.01  # 1% per order
         qty = order_value / fill_price
         
+        pos = self.positions.get(self.symbol)
+        
         if order['side'] == 'BUY':
             # Open or add to position
-            if self.symbol not in self.positions:
+            if pos is None:
                 self.positions[self.symbol] = {
                     'qty': qty,
                     'entry_price': fill_price,
@@ -235,7 +239,6 @@ class HybridBacktester:
                 }
             else:
                 # Average up
-                pos = self.positions[self.symbol]
                 total_qty = pos['qty'] + qty
                 avg_price = (pos['qty'] * pos['entry_price'] + qty * fill_price) / total_qty
                 pos['qty'] = total_qty
@@ -276,9 +279,7 @@ class HybridBacktester:
         
         else:  # SELL
             # Close or reduce position
-            if self.symbol in self.positions:
-                pos = self.positions[self.symbol]
-                
+            if pos is not None:
                 if qty >= pos['qty']:
                     # Close entire position
                     sell_value = pos['qty'] * fill_price
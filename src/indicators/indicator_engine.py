@@ -16,6 +16,13 @@ class IndicatorEngine:
     Engine for calculating and providing technical indicators
     """
     
+    # BB(20, 2.0) column names per band; pandas_ta emits BBU_20_2.0 or,
+    # in newer releases, BBU_20_2.0_2.0
+    BB_COLUMNS = {
+        prefix: (f'{prefix}_20_2.0', f'{prefix}_20_2.0_2.0')
+        for prefix in ('BBU', 'BBM', 'BBL')
+    }
+    
     def __init__(self, symbol: str):
         """
         Initialize Indicator Engine
@@ -26,6 +33,9 @@ class IndicatorEngine:
         self.symbol = symbol
         self._latest_signals: Optional[Dict] = None
         self._df: Optional[pd.DataFrame] = None
+        self._last_key: Optional[tuple] = None
+        # Resolved (BBU, BBM, BBL) column names for the current frame
+        self._bb_cols: tuple = (None, None, None)
     
     def update(self, df: pd.DataFrame):
         """
@@ -37,14 +47,88 @@ class IndicatorEngine:
         if df is None or df.empty:
             return
         
+        # Skip recompute when the frame ends on the same bar with the same values
+        # (live loop polls faster than bars close)
+        key = self._frame_key(df)
+        if key is not None and key == self._last_key:
+            return
+        self._last_key = key
+        
         self._df = df.copy()
+        self._refresh()
+    
+    @classmethod
+    def from_frame(cls, symbol: str, df: pd.DataFrame) -> 'IndicatorEngine':
+        """
+        Create an engine over a frame that already carries indicators
+        
+        Unlike update(), the frame is adopted without a copy: indicators it
+        already has (e.g. from add_all_indicators) are reused and only the
+        missing ones are added to it in place.
+        
+        Args:
+            symbol: Trading pair symbol
+            df: DataFrame with OHLCV data and precomputed indicators
+            
+        Returns:
+            IndicatorEngine with latest signals extracted
+        """
+        engine = cls(symbol)
+        if df is None or df.empty:
+            return engine
         
+        engine._last_key = cls._frame_key(df)
+        engine._df = df
+        engine._refresh()
+        return engine
+    
+    def _refresh(self):
+        """Recompute missing indicators and latest signals for the current frame"""
         # Calculate all indicators
         self._calculate_indicators()
         
+        # Resolve band columns once per update; signal extraction reuses them
+        self._bb_cols = tuple(self._find_bb_column(p) for p in ('BBU', 'BBM', 'BBL'))
+        
         # Extract latest signals
         self._extract_latest_signals()
     
+    def has_changed(self, df: pd.DataFrame) -> bool:
+        """
+        Check whether df differs from the frame of the last update
+        
+        Only length, last index and last-bar OHLCV values are compared, so a
+        raw kline frame can be checked before indicators are added to it.
+        
+        Args:
+            df: DataFrame with OHLCV data
+            
+        Returns:
+            True if update(df) would recompute indicators
+        """
+        if df is None or df.empty:
+            return False
+        key = self._frame_key(df)
+        return key is None or key != self._last_key
+    
+    @staticmethod
+    def _frame_key(df: pd.DataFrame) -> Optional[tuple]:
+        """
+        Build a cheap identity key from frame length and last bar values
+        
+        Args:
+            df: DataFrame with OHLCV data
+            
+        Returns:
+            Tuple key or None if it cannot be built
+        """
+        try:
+            cols = [c for c in ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+                    if c in df.columns]
+            return (len(df), df.index[-1]) + tuple(df[c].iat[-1] for c in cols)
+        except Exception:
+            return None
+    
     def _calculate_indicators(self):
         """Calculate technical indicators on DataFrame"""
         if self._df is None or len(self._df) < 50:
@@ -76,42 +160,67 @@ class IndicatorEngine:
             if ema_data is not None:
                 self._df['EMA_50'] = ema_data
         
-        # Bollinger Bands
-        if 'BBU_20_2.0' not in self._df.columns:
+        # Bollinger Bands (reuse bands already added upstream, e.g. by add_all_indicators)
+        if self._find_bb_column('BBU') is None:
             bb_data = TechnicalIndicators.calculate_bollinger_bands(self._df, 20, 2.0)
             if bb_data is not None and not bb_data.empty:
                 # pandas_ta returns columns with format BBL_20_2.0, BBM_20_2.0, BBU_20_2.0
+                # (newer releases append the second std: BBU_20_2.0_2.0)
                 for col in bb_data.columns:
                     self._df[col] = bb_data[col]
     
+    def _find_bb_column(self, prefix: str) -> Optional[str]:
+        """
+        Find the BB(20, 2.0) column for a band prefix regardless of pandas_ta naming
+        
+        Args:
+            prefix: Band prefix (BBU, BBM or BBL)
+            
+        Returns:
+            Column name or None if not present
+        """
+        columns = self._df.columns
+        for col in self.BB_COLUMNS[prefix]:
+            if col in columns:
+                return col
+        return None
+    
     def _extract_latest_signals(self):
         """Extract latest signals from DataFrame"""
         if self._df is None or self._df.empty:
             return
         
         try:
-            latest = self._df.iloc[-1]
-            close = latest['close']
+            df = self._df
+            columns = df.columns
+            
+            def last(col, default):
+                # Scalar read per column; avoids building a mixed-dtype row Series
+                return df[col].iat[-1] if col in columns else default
+            
+            close = df['close'].iat[-1]
             
             # Calculate ATR%
-            atr = latest.get('ATR_14', 0)
+            atr = last('ATR_14', 0)
             atr_pct = (atr / close * 100) if close > 0 else 0
             
+            bbu_col, bbm_col, bbl_col = self._bb_cols
+            
             self._latest_signals = {
                 'close': close,
-                'open': latest.get('open', close),
-                'high': latest.get('high', close),
-                'low': latest.get('low', close),
-                'volume': latest.get('volume', 0),
-                'rsi': latest.get('RSI_14', 50.0),
+                'open': last('open', close),
+                'high': last('high', close),
+                'low': last('low', close),
+                'volume': last('volume', 0),
+                'rsi': last('RSI_14', 50.0),
                 'atr': atr,
                 'atr_pct': atr_pct,
-                'ema_fast': latest.get('EMA_9', close),
-                'ema_mid': latest.get('EMA_21', close),
-                'ema_slow': latest.get('EMA_50', close),
-                'bb_upper': latest.get('BBU_20_2.0', close * 1.02),
-                'bb_middle': latest.get('BBM_20_2.0', close),
-                'bb_lower': latest.get('BBL_20_2.0', close * 0.98)
+                'ema_fast': last('EMA_9', close),
+                'ema_mid': last('EMA_21', close),
+                'ema_slow': last('EMA_50', close),
+                'bb_upper': df[bbu_col].iat[-1] if bbu_col else close * 1.02,
+                'bb_middle': df[bbm_col].iat[-1] if bbm_col else close,
+                'bb_lower': df[bbl_col].iat[-1] if bbl_col else close * 0.98
             }
         
         except Exception as e:
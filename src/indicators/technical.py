@@ -154,10 +154,12 @@ class TechnicalIndicators:
         Returns:
             DataFrame with volume distribution by price level
         """
-        price_range = df['close'].max() - df['close'].min()
-        bin_size = price_range / bins
+        close = df['close']
+        close_values = close.to_numpy(dtype=float)
+        close_min = np.nanmin(close_values)
+        bin_size = (np.nanmax(close_values) - close_min) / bins
         
-        df['price_bin'] = ((df['close'] - df['close'].min()) / bin_size).astype(int)
+        df['price_bin'] = ((close - close_min) / bin_size).astype(int)
         volume_profile = df.groupby('price_bin')['volume'].sum()
         
         return volume_profile
@@ -176,17 +178,25 @@ class TechnicalIndicators:
         Returns:
             Dictionary with support and resistance levels
         """
-        # Find local maxima (resistance)
-        resistance_levels = []
-        for i in range(window, len(df) - window):
-            if df['high'].iloc[i] == df['high'].iloc[i-window:i+window].max():
-                resistance_levels.append(df['high'].iloc[i])
+        high = df['high'].to_numpy(dtype=float)
+        low = df['low'].to_numpy(dtype=float)
+        n_windows = len(df) - 2 * window
         
-        # Find local minima (support)
+        resistance_levels = []
         support_levels = []
-        for i in range(window, len(df) - window):
-            if df['low'].iloc[i] == df['low'].iloc[i-window:i+window].min():
-                support_levels.append(df['low'].iloc[i])
+        if window > 0 and n_windows > 0:
+            # Window [i-window, i+window) for every candidate bar i, in one pass
+            high_win = np.lib.stride_tricks.sliding_window_view(high, 2 * window)[:n_windows]
+            low_win = np.lib.stride_tricks.sliding_window_view(low, 2 * window)[:n_windows]
+            center = slice(window, window + n_windows)
+            
+            # Find local maxima (resistance)
+            is_peak = high[center] == np.fmax.reduce(high_win, axis=1)
+            resistance_levels = high[center][is_peak].tolist()
+            
+            # Find local minima (support)
+            is_trough = low[center] == np.fmin.reduce(low_win, axis=1)
+            support_levels = low[center][is_trough].tolist()
         
         # Cluster nearby levels
         def cluster_levels(levels, threshold):
@@ -236,15 +246,16 @@ class TechnicalIndicators:
         Returns:
             Trend direction: 'uptrend', 'downtrend', or 'sideways'
         """
-        fast_ma = ta.sma(df['close'], length=ma_fast)
-        slow_ma = ta.sma(df['close'], length=ma_slow)
+        fast_ma = ta.sma(df['close'], length=ma_fast).to_numpy()
+        slow_last = ta.sma(df['close'], length=ma_slow).iat[-1]
+        fast_last = fast_ma[-1]
         
-        if fast_ma.iloc[-1] > slow_ma.iloc[-1]:
+        if fast_last > slow_last:
             # Check if trend is strong
-            if fast_ma.iloc[-1] > fast_ma.iloc[-5]:
+            if fast_last > fast_ma[-5]:
                 return 'uptrend'
-        elif fast_ma.iloc[-1] < slow_ma.iloc[-1]:
-            if fast_ma.iloc[-1] < fast_ma.iloc[-5]:
+        elif fast_last < slow_last:
+            if fast_last < fast_ma[-5]:
                 return 'downtrend'
         
         return 'sideways'
@@ -268,15 +279,15 @@ class TechnicalIndicators:
         atr = TechnicalIndicators.calculate_atr(df, atr_period)
         adx_data = TechnicalIndicators.calculate_adx(df, adx_period)
         
-        # Normalize ATR by price
-        atr_pct = (atr / df['close']) * 100
+        # Normalize ATR by price (only the last 50 periods are used)
+        atr_tail = (atr.to_numpy()[-50:] / df['close'].to_numpy()[-50:]) * 100
         
         # Determine volatility (high if ATR > median of last 50 periods)
-        atr_median = atr_pct.iloc[-50:].median()
-        is_high_vol = atr_pct.iloc[-1] > atr_median
+        atr_median = np.nanmedian(atr_tail) if not np.isnan(atr_tail).all() else np.nan
+        is_high_vol = atr_tail[-1] > atr_median
         
         # Determine if trending
-        adx_value = adx_data[f'ADX_{adx_period}'].iloc[-1]
+        adx_value = adx_data[f'ADX_{adx_period}'].iat[-1]
         is_trending = adx_value > adx_threshold
         
         if is_trending:
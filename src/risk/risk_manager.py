@@ -22,13 +22,13 @@ class RiskManager:
         self.portfolio = portfolio
         
         # Load risk limits from config
-        risk_limits = config.get_risk_limits()
-        self.max_risk_per_trade = risk_limits['max_risk_per_trade']
-        self.max_daily_loss = risk_limits['max_daily_loss']
-        self.max_weekly_loss = risk_limits['max_weekly_loss']
-        self.min_cash_reserve = risk_limits['min_cash_reserve']
-        self.max_positions = risk_limits['max_positions']
-        self.max_strategies_per_pair = risk_limits['max_strategies_per_pair']
+        risk_limits = config.risk_limits
+        self.max_risk_per_trade = risk_limits.max_risk_per_trade
+        self.max_daily_loss = risk_limits.max_daily_loss
+        self.max_weekly_loss = risk_limits.max_weekly_loss
+        self.min_cash_reserve = risk_limits.min_cash_reserve
+        self.max_positions = risk_limits.max_positions
+        self.max_strategies_per_pair = risk_limits.max_strategies_per_pair
         
         # Circuit breaker state
         self.circuit_breaker_active = False
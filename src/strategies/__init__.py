@@ -4,7 +4,7 @@ Trading strategies package
 Only Hybrid Strategy Engine is maintained.
 Old strategies (DCA, Grid, Trend, Mean Reversion) have been removed.
 """
-from .hybrid_strategy_engine import HybridStrategyEngine
+from .hybrid_strategy_engine import HybridStrategyEngine, PolicyConfig
 
-__all__ = ['HybridStrategyEngine']
+__all__ = ['HybridStrategyEngine', 'PolicyConfig']
 
@@ -24,12 +24,240 @@ Interface (Option-A):
         - "ref_price": float
         - "kill_replace": bool
 
+    on_bars_batch(close, rsi, atr_pct, ema_fast, ts, equity) -> per-bar arrays
+        for offline runs (stateless: no cooldowns or hard-stop latch)
+
 Note: This engine does NOT send orders. Orchestrator handles tick/lot/min_notional.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, NamedTuple, Optional, Any
+from dataclasses import dataclass, fields
 from datetime import datetime
 import logging
+import re
+import sys
+import numpy as np
+
+
+# PnL Gate states, volatility bands and order sides
+GATE_RUN = sys.intern("RUN")
+GATE_DEGRADED = sys.intern("DEGRADED")
+GATE_PAUSED = sys.intern("PAUSED")
+BAND_NEAR = sys.intern("near")
+BAND_MID = sys.intern("mid")
+BAND_FAR = sys.intern("far")
+SIDE_BUY = sys.intern("BUY")
+SIDE_SELL = sys.intern("SELL")
+
+# Bands are int codes internally; names are only emitted in the plan
+BAND_NEAR_IDX, BAND_MID_IDX, BAND_FAR_IDX = 0, 1, 2
+BAND_NAMES = (BAND_NEAR, BAND_MID, BAND_FAR)
+
+# RSI labels 0..100; str(round(rsi)) matches f'{rsi:.0f}' (both round half-even)
+_RSI_LABELS = tuple(str(i) for i in range(101))
+
+# Bar timeframe parsing ('30s', '1m', '4h', '1d')
+_TF_RE = re.compile(r'^(\d+)([smhd])$')
+_TF_MULT = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+@dataclass(frozen=True, slots=True)
+class PolicyConfig:
+    """
+    Policy configuration for HybridStrategyEngine, read once from policy_cfg
+    """
+    # Spread configuration
+    use_dynamic_spread: bool = True
+    fixed_spread_pct: float = 0.5
+    
+    # Band thresholds (ATR%)
+    band_near_threshold: float = 1.0
+    band_mid_threshold: float = 2.0
+    
+    # Spread by band
+    spread_near_pct: float = 0.3
+    spread_mid_pct: float = 0.5
+    spread_far_pct: float = 0.8
+    
+    # RSI adjustment
+    rsi_adjust_enabled: bool = True
+    rsi_adjust_factor: float = 0.1
+    
+    # Grid configuration
+    grid_enabled: bool = True
+    grid_levels_per_side: int = 3
+    grid_kill_replace_threshold_pct: float = 1.0
+    grid_min_seconds_between: float = 300
+    
+    # DCA configuration
+    dca_enabled: bool = True
+    dca_rsi_threshold: float = 35
+    dca_use_ema_gate: bool = True
+    dca_cooldown_bars: float = 5
+    dca_min_distance_from_last_fill_pct: float = 1.0
+    dca_price_offset_pct: float = 0.1
+    
+    # TP configuration
+    tp_enabled: bool = True
+    tp_rsi_threshold: float = 65
+    tp_spread_near_pct: float = 0.5
+    tp_spread_mid_pct: float = 0.8
+    tp_spread_far_pct: float = 1.2
+    
+    # PnL Gate configuration
+    gate_degraded_gap_pct: float = -3.0
+    gate_paused_gap_pct: float = -5.0
+    gate_degraded_daily_pnl_pct: float = -2.0
+    gate_paused_daily_pnl_pct: float = -4.0
+    
+    # Stop-Loss configuration
+    hard_stop_daily_pnl_pct: float = -5.0
+    hard_stop_gap_pct: float = -8.0
+    
+    # Bar timeframe (for cooldown calculation)
+    bar_timeframe: str = '1m'
+    
+    # Auto-resume configuration
+    auto_resume_enabled: bool = True
+    resume_rsi_threshold: float = 40  # RSI > 40 = oversold recovery
+    resume_price_recovery_pct: float = 2.0  # Price recovers 2%
+    resume_cooldown_bars: float = 60  # Wait 60 bars after stop
+    
+    @classmethod
+    def from_dict(cls, policy_cfg: Dict) -> 'PolicyConfig':
+        """
+        Build config from a policy dict, using field defaults for missing keys
+        
+        Args:
+            policy_cfg: Policy configuration from YAML
+            
+        Returns:
+            PolicyConfig instance
+        """
+        return cls(**{
+            f.name: policy_cfg.get(f.name, f.default) for f in fields(cls)
+        })
+
+
+class Signals(NamedTuple):
+    """
+    Validated technical signals used by the planners for one bar
+    """
+    close: float
+    rsi: float
+    atr_pct: float
+    ema_fast: float
+    ema_mid: float
+    ema_slow: float
+
+
+def _band_and_spread(atr_pct: float, rsi: float, cfg: PolicyConfig) -> tuple:
+    """
+    Pick volatility band and spread from ATR% and RSI
+    
+    Args:
+        atr_pct: ATR as percentage of price
+        rsi: RSI value
+        cfg: Policy configuration
+        
+    Returns:
+        Tuple of (band_idx, spread_pct)
+    """
+    # Determine band based on ATR%
+    if atr_pct < cfg.band_near_threshold:
+        band_idx = BAND_NEAR_IDX
+        base_spread = cfg.spread_near_pct
+    elif atr_pct < cfg.band_mid_threshold:
+        band_idx = BAND_MID_IDX
+        base_spread = cfg.spread_mid_pct
+    else:
+        band_idx = BAND_FAR_IDX
+        base_spread = cfg.spread_far_pct
+    
+    # RSI adjustment
+    if cfg.rsi_adjust_enabled:
+        # RSI < 30: tighten spread (more aggressive buying)
+        # RSI > 70: widen spread (more conservative)
+        rsi_factor = 1.0
+        if rsi < 30:
+            rsi_factor = 1.0 - cfg.rsi_adjust_factor
+        elif rsi > 70:
+            rsi_factor = 1.0 + cfg.rsi_adjust_factor
+        
+        spread_pct = base_spread * rsi_factor
+    else:
+        spread_pct = base_spread
+    
+    # Clamp to reasonable range
+    spread_pct = max(0.1, min(2.0, spread_pct))
+    
+    return band_idx, spread_pct
+
+
+def _band_and_spread_batch(atr_pct: np.ndarray, rsi: np.ndarray,
+                           cfg: PolicyConfig) -> tuple:
+    """
+    Vectorized _band_and_spread over arrays of ATR% and RSI
+    
+    Args:
+        atr_pct: ATR as percentage of price, one value per bar
+        rsi: RSI values, one per bar
+        cfg: Policy configuration
+    
+    Returns:
+        Tuple of (band_idx array, spread_pct array)
+    """
+    band_idx = np.select(
+        [atr_pct < cfg.band_near_threshold, atr_pct < cfg.band_mid_threshold],
+        [BAND_NEAR_IDX, BAND_MID_IDX],
+        default=BAND_FAR_IDX,
+    )
+    base_spread = np.choose(
+        band_idx, (cfg.spread_near_pct, cfg.spread_mid_pct, cfg.spread_far_pct)
+    )
+    
+    if cfg.rsi_adjust_enabled:
+        f = cfg.rsi_adjust_factor
+        rsi_factor = np.where(rsi < 30, 1.0 - f, np.where(rsi > 70, 1.0 + f, 1.0))
+        base_spread = base_spread * rsi_factor
+    
+    return band_idx, np.clip(base_spread, 0.1, 2.0)
+
+
+def _frac_change(value: float, base: Optional[float]) -> float:
+    """
+    Fractional change of value vs base (0.0 when base is unset or not positive)
+    
+    Args:
+        value: Current value
+        base: Reference value
+        
+    Returns:
+        Change as a ratio (0.01 == 1%)
+    """
+    if base is not None and base > 0:
+        return (value - base) / base
+    return 0.0
+
+
+def _gate_state(daily_pnl: float, gap: float, gate_fracs: tuple) -> str:
+    """
+    Map Daily PnL and Gap (both as fractions) onto the PnL Gate state
+    
+    Args:
+        daily_pnl: Equity change since day open as a fraction
+        gap: Price change since day open as a fraction
+        gate_fracs: (paused_pnl, paused_gap, degraded_pnl, degraded_gap) fractions
+        
+    Returns:
+        "RUN", "DEGRADED" or "PAUSED"
+    """
+    paused_pnl, paused_gap, degraded_pnl, degraded_gap = gate_fracs
+    if daily_pnl <= paused_pnl or gap <= paused_gap:
+        return GATE_PAUSED
+    elif daily_pnl <= degraded_pnl or gap <= degraded_gap:
+        return GATE_DEGRADED
+    return GATE_RUN
 
 
 class HybridStrategyEngine:
@@ -37,6 +265,22 @@ class HybridStrategyEngine:
     Hybrid Strategy Engine combining Grid + DCA with dynamic spread
     """
     
+    __slots__ = (
+        'symbol', 'policy_cfg', 'indicator_engine', 'logger', 'cfg',
+        '_last_grid_ref_price', '_last_grid_ts_float',
+        '_last_dca_ts_float', '_last_dca_fill_price',
+        '_open_price_day', '_equity_open', '_last_date', '_last_date_ordinal',
+        '_bar_seconds', '_dca_cooldown_seconds', '_resume_cooldown_seconds',
+        '_grid_idx', '_grid_tags', '_dca_price_mult', '_tp_mult_by_band',
+        '_dca_tags', '_tp_tags',
+        '_grid_kill_frac', '_dca_min_dist_frac', '_hard_stop_daily_frac',
+        '_hard_stop_gap_frac', '_gate_fracs', '_resume_recovery_frac',
+        '_hard_stop_active', '_hard_stop_timestamp', '_hard_stop_ts_float',
+        '_hard_stop_price',
+        '_hard_stop_reason', '_missing_fields_warned', '_state_dict',
+        '_gate_cache_key', '_gate_cache_val', '_bar_timestamp',
+    )
+    
     def __init__(self, symbol: str, policy_cfg: Dict, indicator_engine):
         """
         Initialize Hybrid Strategy Engine
@@ -54,203 +298,318 @@ class HybridStrategyEngine:
         
         # State tracking
         self._last_grid_ref_price: Optional[float] = None
-        self._last_grid_timestamp: Optional[datetime] = None
-        self._last_dca_timestamp: Optional[datetime] = None
+        # Cooldown baselines as unix epoch seconds (elapsed is one float subtract)
+        self._last_grid_ts_float: Optional[float] = None
+        self._last_dca_ts_float: Optional[float] = None
         self._last_dca_fill_price: Optional[float] = None
+        # Current bar datetime, published in get_state alongside the baselines
+        self._bar_timestamp: Optional[datetime] = None
         
         # PnL Gate tracking
         self._open_price_day: Optional[float] = None
         self._equity_open: Optional[float] = None
         self._last_date: Optional[str] = None
+        self._last_date_ordinal: Optional[int] = None
+        self._gate_cache_key: Optional[tuple] = None
+        self._gate_cache_val: Optional[str] = None
+        
+        # Signal fields already reported missing
+        self._missing_fields_warned: set = set()
         
         # Configuration
         self._load_config()
         
+        # Snapshot returned by get_state, updated in place as state changes
+        self._state_dict = {
+            'symbol': symbol,
+            'last_grid_ref_price': None,
+            'last_grid_timestamp': None,
+            'last_dca_timestamp': None,
+            'last_dca_fill_price': None,
+            'open_price_day': None,
+            'equity_open': None,
+            'last_date': None,
+            'hard_stop_active': False,
+            'hard_stop_timestamp': None,
+            'hard_stop_price': None,
+            'hard_stop_reason': None
+        }
+        
         self.logger.info(f"HybridStrategyEngine initialized for {symbol}")
     
     def _load_config(self):
         """Load configuration from policy_cfg"""
-        # Spread configuration
-        self.use_dynamic_spread = self.policy_cfg.get('use_dynamic_spread', True)
-        self.fixed_spread_pct = self.policy_cfg.get('fixed_spread_pct', 0.5)
-        
-        # Band thresholds (ATR%)
-        self.band_near_threshold = self.policy_cfg.get('band_near_threshold', 1.0)
-        self.band_mid_threshold = self.policy_cfg.get('band_mid_threshold', 2.0)
-        
-        # Spread by band
-        self.spread_near_pct = self.policy_cfg.get('spread_near_pct', 0.3)
-        self.spread_mid_pct = self.policy_cfg.get('spread_mid_pct', 0.5)
-        self.spread_far_pct = self.policy_cfg.get('spread_far_pct', 0.8)
-        
-        # RSI adjustment
-        self.rsi_adjust_enabled = self.policy_cfg.get('rsi_adjust_enabled', True)
-        self.rsi_adjust_factor = self.policy_cfg.get('rsi_adjust_factor', 0.1)
-        
-        # Grid configuration
-        self.grid_enabled = self.policy_cfg.get('grid_enabled', True)
-        self.grid_levels_per_side = self.policy_cfg.get('grid_levels_per_side', 3)
-        self.grid_kill_replace_threshold_pct = self.policy_cfg.get(
-            'grid_kill_replace_threshold_pct', 1.0
-        )
-        self.grid_min_seconds_between = self.policy_cfg.get('grid_min_seconds_between', 300)
-        
-        # DCA configuration
-        self.dca_enabled = self.policy_cfg.get('dca_enabled', True)
-        self.dca_rsi_threshold = self.policy_cfg.get('dca_rsi_threshold', 35)
-        self.dca_use_ema_gate = self.policy_cfg.get('dca_use_ema_gate', True)
-        self.dca_cooldown_bars = self.policy_cfg.get('dca_cooldown_bars', 5)
-        self.dca_min_distance_from_last_fill_pct = self.policy_cfg.get(
-            'dca_min_distance_from_last_fill_pct', 1.0
-        )
-        self.dca_price_offset_pct = self.policy_cfg.get('dca_price_offset_pct', 0.1)
+        self.cfg = PolicyConfig.from_dict(self.policy_cfg)
+        cfg = self.cfg
         
-        # TP configuration
-        self.tp_enabled = self.policy_cfg.get('tp_enabled', True)
-        self.tp_rsi_threshold = self.policy_cfg.get('tp_rsi_threshold', 65)
-        self.tp_spread_near_pct = self.policy_cfg.get('tp_spread_near_pct', 0.5)
-        self.tp_spread_mid_pct = self.policy_cfg.get('tp_spread_mid_pct', 0.8)
-        self.tp_spread_far_pct = self.policy_cfg.get('tp_spread_far_pct', 1.2)
+        # Bar timeframe (for cooldown calculation)
+        self._bar_seconds = self._parse_timeframe_to_seconds(cfg.bar_timeframe)
+        self._dca_cooldown_seconds = cfg.dca_cooldown_bars * self._bar_seconds
+        self._resume_cooldown_seconds = cfg.resume_cooldown_bars * self._bar_seconds
         
-        # PnL Gate configuration
-        self.gate_degraded_gap_pct = self.policy_cfg.get('gate_degraded_gap_pct', -3.0)
-        self.gate_paused_gap_pct = self.policy_cfg.get('gate_paused_gap_pct', -5.0)
-        self.gate_degraded_daily_pnl_pct = self.policy_cfg.get('gate_degraded_daily_pnl_pct', -2.0)
-        self.gate_paused_daily_pnl_pct = self.policy_cfg.get('gate_paused_daily_pnl_pct', -4.0)
+        # Grid level indices and tags (level count is fixed by config)
+        self._grid_idx = np.arange(1, cfg.grid_levels_per_side + 1, dtype=np.float64)
+        self._grid_tags = [
+            (f'grid_buy_{i}', f'grid_sell_{i}')
+            for i in range(1, cfg.grid_levels_per_side + 1)
+        ]
         
-        # Stop-Loss configuration
-        self.hard_stop_daily_pnl_pct = self.policy_cfg.get('hard_stop_daily_pnl_pct', -5.0)
-        self.hard_stop_gap_pct = self.policy_cfg.get('hard_stop_gap_pct', -8.0)
+        # Precomputed price multipliers (config is static after load)
+        self._dca_price_mult = 1 - cfg.dca_price_offset_pct / 100
+        self._tp_mult_by_band = (
+            1 + cfg.tp_spread_near_pct / 100,
+            1 + cfg.tp_spread_mid_pct / 100,
+            1 + cfg.tp_spread_far_pct / 100,
+        )
         
-        # Bar timeframe (for cooldown calculation)
-        self.bar_timeframe = self.policy_cfg.get('bar_timeframe', '1m')
-        self._bar_seconds = self._parse_timeframe_to_seconds(self.bar_timeframe)
+        # Percent thresholds as fractions, so the hot path compares raw
+        # ratios and only scales by 100 for log output
+        self._grid_kill_frac = cfg.grid_kill_replace_threshold_pct * 0.01
+        self._dca_min_dist_frac = cfg.dca_min_distance_from_last_fill_pct * 0.01
+        self._hard_stop_daily_frac = cfg.hard_stop_daily_pnl_pct * 0.01
+        self._hard_stop_gap_frac = cfg.hard_stop_gap_pct * 0.01
+        self._gate_fracs = (
+            cfg.gate_paused_daily_pnl_pct * 0.01,
+            cfg.gate_paused_gap_pct * 0.01,
+            cfg.gate_degraded_daily_pnl_pct * 0.01,
+            cfg.gate_degraded_gap_pct * 0.01,
+        )
+        self._resume_recovery_frac = cfg.resume_price_recovery_pct * 0.01
         
-        # Auto-resume configuration
-        self.auto_resume_enabled = self.policy_cfg.get('auto_resume_enabled', True)
-        self.resume_rsi_threshold = self.policy_cfg.get('resume_rsi_threshold', 40)  # RSI > 40 = oversold recovery
-        self.resume_price_recovery_pct = self.policy_cfg.get('resume_price_recovery_pct', 2.0)  # Price recovers 2%
-        self.resume_cooldown_bars = self.policy_cfg.get('resume_cooldown_bars', 60)  # Wait 60 bars after stop
+        # Pre-built DCA/TP tags indexed by rounded RSI (TP also by band_idx)
+        self._dca_tags = tuple(f'dca_rsi{label}' for label in _RSI_LABELS)
+        self._tp_tags = tuple(
+            tuple(f'tp_rsi{label}_band{band}' for label in _RSI_LABELS)
+            for band in BAND_NAMES
+        )
         
         # Hard stop tracking
         self._hard_stop_active = False
         self._hard_stop_timestamp = None
+        self._hard_stop_ts_float = None
         self._hard_stop_price = None
         self._hard_stop_reason = None
     
     def _parse_timeframe_to_seconds(self, timeframe: str) -> int:
-        """Parse timeframe string to seconds"""
-        if timeframe.endswith('m'):
-            return int(timeframe[:-1]) * 60
-        elif timeframe.endswith('h'):
-            return int(timeframe[:-1]) * 3600
-        elif timeframe.endswith('d'):
-            return int(timeframe[:-1]) * 86400
-        else:
-            return 60  # Default 1 minute
+        """Parse timeframe string to seconds (raises ValueError if unsupported)"""
+        m = _TF_RE.match(timeframe)
+        if m is None:
+            raise ValueError(f"Unsupported bar_timeframe: {timeframe!r}")
+        return int(m.group(1)) * _TF_MULT[m.group(2)]
     
     def on_bar(self, bar: Dict, equity: float) -> Dict:
         """
         Main entry point - process new bar and generate trading plan
         
         Args:
-            bar: OHLCV bar data with timestamp
+            bar: OHLCV bar data with timestamp (optionally 'timestamp_float'
+                as unix epoch seconds, which skips the datetime conversion)
             equity: Current portfolio equity
             
         Returns:
             Plan dictionary with orders and state
         """
-        # Initialize plan
-        plan = {
-            "pnl_gate_state": "RUN",
-            "sl_action": {"stop": False},
-            "grid_orders": [],
-            "dca_orders": [],
-            "tp_orders": [],
-            "band": "mid",
-            "spread_pct": self.fixed_spread_pct,
-            "ref_price": bar['close'],
-            "kill_replace": False
-        }
+        log = self.logger
+        # Plan fields; the dict and any empty order lists are built once at the end
+        gate_state = GATE_RUN
+        sl_action = None
+        grid_orders = dca_orders = tp_orders = None
+        band_idx = BAND_MID_IDX
+        spread_pct = self.cfg.fixed_spread_pct
+        ref_price = bar['close']
+        kill_replace = False
         
         try:
+            self._bar_timestamp = bar['timestamp']
+            ts_float = bar.get('timestamp_float')
+            if ts_float is None:
+                ts_float = self._bar_timestamp.timestamp()
+            
             # Get technical signals from IndicatorEngine
             signals = self._get_technical_signals()
             
             if not signals:
-                self.logger.warning("No technical signals available")
-                return plan
-            
-            # Update ref_price from bar
-            ref_price = bar['close']
-            plan['ref_price'] = ref_price
-            
-            # Compute dynamic spread and band
-            band, spread_pct = self._compute_band_and_spread(signals)
-            plan['band'] = band
-            plan['spread_pct'] = spread_pct
-            
-            # Evaluate PnL Gate and Stop-Loss
-            gate_state, sl_action = self._evaluate_gate_and_sl(
-                bar, equity, ref_price
-            )
-            plan['pnl_gate_state'] = gate_state
-            plan['sl_action'] = sl_action
-            
-            # If hard stop triggered, return immediately
-            if sl_action['stop']:
-                self.logger.critical(f"Hard stop triggered: {sl_action.get('reason')}")
-                return plan
-            
-            # Plan orders based on state
-            if gate_state == "RUN":
-                # Full operation
-                if self.grid_enabled:
-                    grid_orders, kill_replace = self._plan_grid(
-                        ref_price, spread_pct, bar['timestamp']
-                    )
-                    plan['grid_orders'] = grid_orders
-                    plan['kill_replace'] = kill_replace
+                log.warning("No technical signals available")
+            else:
+                # Compute dynamic spread and band
+                band_idx, spread_pct = self._compute_band_and_spread(signals)
                 
-                if self.dca_enabled:
-                    dca_orders = self._plan_dca(
-                        ref_price, signals, bar['timestamp']
-                    )
-                    plan['dca_orders'] = dca_orders
+                # Evaluate PnL Gate and Stop-Loss
+                gate_state, sl_action = self._evaluate_gate_and_sl(
+                    bar, equity, ref_price, ts_float, signals
+                )
                 
-                if self.tp_enabled:
-                    tp_orders = self._plan_tp(
-                        ref_price, signals, band
-                    )
-                    plan['tp_orders'] = tp_orders
-            
-            elif gate_state == "DEGRADED":
-                # Reduced operation - only DCA and TP
-                if self.dca_enabled:
-                    dca_orders = self._plan_dca(
-                        ref_price, signals, bar['timestamp']
-                    )
-                    plan['dca_orders'] = dca_orders
+                if sl_action['stop']:
+                    # Hard stop triggered: no orders
+                    log.critical(f"Hard stop triggered: {sl_action.get('reason')}")
                 
-                if self.tp_enabled:
-                    tp_orders = self._plan_tp(
-                        ref_price, signals, band
-                    )
-                    plan['tp_orders'] = tp_orders
-            
-            # PAUSED: no new orders
+                # Plan orders based on state
+                elif gate_state == GATE_RUN:
+                    # Full operation
+                    if self.cfg.grid_enabled:
+                        grid_orders, kill_replace = self._plan_grid(
+                            ref_price, spread_pct, ts_float
+                        )
+                    
+                    if self.cfg.dca_enabled:
+                        dca_orders = self._plan_dca(
+                            ref_price, signals, ts_float
+                        )
+                    
+                    if self.cfg.tp_enabled:
+                        tp_orders = self._plan_tp(
+                            ref_price, signals, band_idx
+                        )
+                
+                elif gate_state == GATE_DEGRADED:
+                    # Reduced operation - only DCA and TP
+                    if self.cfg.dca_enabled:
+                        dca_orders = self._plan_dca(
+                            ref_price, signals, ts_float
+                        )
+                    
+                    if self.cfg.tp_enabled:
+                        tp_orders = self._plan_tp(
+                            ref_price, signals, band_idx
+                        )
+                
+                # PAUSED: no new orders
             
         except Exception as e:
-            self.logger.error(f"Error in on_bar: {e}", exc_info=True)
+            # Helpers are straight-line; any failure lands here once and
+            # the bar is treated as PAUSED so no partial plan is acted on
+            log.error(f"Error in on_bar: {e}", exc_info=True)
+            gate_state = GATE_PAUSED
+            grid_orders = dca_orders = tp_orders = None
+            kill_replace = False
+        
+        return {
+            "pnl_gate_state": gate_state,
+            "sl_action": sl_action if sl_action is not None else {"stop": False},
+            "grid_orders": grid_orders if grid_orders is not None else [],
+            "dca_orders": dca_orders if dca_orders is not None else [],
+            "tp_orders": tp_orders if tp_orders is not None else [],
+            "band": BAND_NAMES[band_idx],
+            "spread_pct": spread_pct,
+            "ref_price": ref_price,
+            "kill_replace": kill_replace
+        }
+    
+    def on_bars_batch(self, close: np.ndarray, rsi: np.ndarray,
+                      atr_pct: np.ndarray, ema_fast: np.ndarray,
+                      ts: np.ndarray, equity: np.ndarray) -> Dict:
+        """
+        Vectorized planning over a block of bars (offline backtests/research)
+        
+        Band, spread, PnL Gate and the DCA/TP triggers are evaluated on whole
+        arrays. Path-dependent state (grid/DCA cooldowns, DCA fill distance,
+        hard-stop latch and auto-resume) is not replayed and engine state is
+        not touched; use on_bar for the exact per-bar semantics.
+        
+        Args:
+            close: Close prices (used as ref_price)
+            rsi: RSI values
+            atr_pct: ATR as percentage of price
+            ema_fast: Fast EMA values
+            ts: Bar timestamps (datetime64 or anything np.asarray converts)
+            equity: Portfolio equity per bar
+        
+        Returns:
+            Dictionary of per-bar arrays ("pnl_gate_state", "stop", "band",
+            "spread_pct", "ref_price") plus "dca_orders"/"tp_orders" lists for
+            the bars that trigger, each order carrying its "bar" index
+        """
+        cfg = self.cfg
+        close = np.asarray(close, dtype=np.float64)
+        rsi = np.asarray(rsi, dtype=np.float64)
+        atr_pct = np.asarray(atr_pct, dtype=np.float64)
+        ema_fast = np.asarray(ema_fast, dtype=np.float64)
+        equity = np.asarray(equity, dtype=np.float64)
+        n = close.shape[0]
+        
+        # Band and spread
+        if cfg.use_dynamic_spread:
+            band_idx, spread_pct = _band_and_spread_batch(atr_pct, rsi, cfg)
+        else:
+            band_idx = np.full(n, BAND_MID_IDX)
+            spread_pct = np.full(n, cfg.fixed_spread_pct)
+        
+        # Day open price/equity: first bar of each calendar day in the block
+        days = np.asarray(ts, dtype='datetime64[D]')
+        new_day = np.ones(n, dtype=bool)
+        new_day[1:] = days[1:] != days[:-1]
+        day_start = np.maximum.accumulate(np.where(new_day, np.arange(n), 0))
+        open_price = close[day_start]
+        equity_open = equity[day_start]
         
-        return plan
+        with np.errstate(divide='ignore', invalid='ignore'):
+            gap = np.where(open_price > 0, close / open_price - 1.0, 0.0)
+            daily_pnl = np.where(equity_open > 0, equity / equity_open - 1.0, 0.0)
+        
+        # Gate state codes: 0=RUN, 1=DEGRADED, 2=PAUSED (hard stop forces PAUSED)
+        paused_pnl, paused_gap, degraded_pnl, degraded_gap = self._gate_fracs
+        stop = (daily_pnl <= self._hard_stop_daily_frac) | (gap <= self._hard_stop_gap_frac)
+        gate_code = np.select(
+            [stop | (daily_pnl <= paused_pnl) | (gap <= paused_gap),
+             (daily_pnl <= degraded_pnl) | (gap <= degraded_gap)],
+            [2, 1],
+            default=0,
+        )
+        active = gate_code < 2
+        
+        # DCA/TP triggers; orders are materialized only for triggering bars
+        dca_orders = []
+        if cfg.dca_enabled:
+            dca_mask = active & (rsi < cfg.dca_rsi_threshold)
+            if cfg.dca_use_ema_gate:
+                dca_mask &= close < ema_fast
+            idx = np.flatnonzero(dca_mask)
+            dca_orders = [
+                {'bar': i, 'side': SIDE_BUY, 'price': price,
+                 'tag': (self._dca_tags[round(r)] if 0 < r <= 100
+                         else f'dca_rsi{r:.0f}')}
+                for i, price, r in zip(
+                    idx.tolist(),
+                    (close[idx] * self._dca_price_mult).tolist(),
+                    rsi[idx].tolist(),
+                )
+            ]
+        
+        tp_orders = []
+        if cfg.tp_enabled:
+            tp_mask = active & (rsi >= cfg.tp_rsi_threshold) & (close >= ema_fast)
+            idx = np.flatnonzero(tp_mask)
+            bands = band_idx[idx]
+            tp_orders = [
+                {'bar': i, 'side': SIDE_SELL, 'price': price,
+                 'tag': (self._tp_tags[b][round(r)] if 0 < r <= 100
+                         else f'tp_rsi{r:.0f}_band{BAND_NAMES[b]}')}
+                for i, price, r, b in zip(
+                    idx.tolist(),
+                    (close[idx] * np.choose(bands, self._tp_mult_by_band)).tolist(),
+                    rsi[idx].tolist(),
+                    bands.tolist(),
+                )
+            ]
+        
+        return {
+            "pnl_gate_state": np.array(
+                (GATE_RUN, GATE_DEGRADED, GATE_PAUSED), dtype=object
+            )[gate_code],
+            "stop": stop,
+            "band": np.array(BAND_NAMES, dtype=object)[band_idx],
+            "spread_pct": spread_pct,
+            "ref_price": close,
+            "dca_orders": dca_orders,
+            "tp_orders": tp_orders,
+        }
     
-    def _get_technical_signals(self) -> Optional[Dict]:
+    def _get_technical_signals(self) -> Optional[Signals]:
         """
         Get technical signals from IndicatorEngine
         
         Returns:
-            Dictionary with technical indicators or None
+            Signals tuple with the required indicators or None
         """
         try:
             signals = self.indicator_engine.latest()
@@ -258,261 +617,239 @@ class HybridStrategyEngine:
             if not signals:
                 return None
             
-            # Validate required fields
-            required = ['close', 'rsi', 'atr_pct', 'ema_fast', 'ema_mid', 'ema_slow']
-            for field in required:
+            # Validate required fields (each missing field is warned about once)
+            for field in Signals._fields:
                 if field not in signals:
-                    self.logger.warning(f"Missing required field: {field}")
+                    if field not in self._missing_fields_warned:
+                        self._missing_fields_warned.add(field)
+                        self.logger.warning(f"Missing required field: {field}")
                     return None
             
-            return signals
+            return Signals(
+                signals['close'], signals['rsi'], signals['atr_pct'],
+                signals['ema_fast'], signals['ema_mid'], signals['ema_slow']
+            )
         
         except Exception as e:
             self.logger.error(f"Error getting technical signals: {e}")
             return None
     
-    def _compute_band_and_spread(self, signals: Dict) -> tuple:
+    def _compute_band_and_spread(self, signals: Signals) -> tuple:
         """
         Compute band (near/mid/far) and spread percentage
         
         Args:
-            signals: Technical signals dictionary
+            signals: Technical signals
             
         Returns:
-            Tuple of (band, spread_pct)
+            Tuple of (band_idx, spread_pct)
         """
-        if not self.use_dynamic_spread:
-            return "mid", self.fixed_spread_pct
+        if not self.cfg.use_dynamic_spread:
+            return BAND_MID_IDX, self.cfg.fixed_spread_pct
         
-        try:
-            atr_pct = signals.get('atr_pct', 1.0)
-            rsi = signals.get('rsi', 50.0)
-            
-            # Determine band based on ATR%
-            if atr_pct < self.band_near_threshold:
-                band = "near"
-                base_spread = self.spread_near_pct
-            elif atr_pct < self.band_mid_threshold:
-                band = "mid"
-                base_spread = self.spread_mid_pct
-            else:
-                band = "far"
-                base_spread = self.spread_far_pct
-            
-            # RSI adjustment
-            if self.rsi_adjust_enabled:
-                # RSI < 30: tighten spread (more aggressive buying)
-                # RSI > 70: widen spread (more conservative)
-                rsi_factor = 1.0
-                if rsi < 30:
-                    rsi_factor = 1.0 - self.rsi_adjust_factor
-                elif rsi > 70:
-                    rsi_factor = 1.0 + self.rsi_adjust_factor
-                
-                spread_pct = base_spread * rsi_factor
-            else:
-                spread_pct = base_spread
-            
-            # Clamp to reasonable range
-            spread_pct = max(0.1, min(2.0, spread_pct))
-            
-            return band, spread_pct
-        
-        except Exception as e:
-            self.logger.error(f"Error computing band and spread: {e}")
-            return "mid", self.fixed_spread_pct
+        return _band_and_spread(signals.atr_pct, signals.rsi, self.cfg)
     
     def _plan_grid(self, ref_price: float, spread_pct: float, 
-                   timestamp: datetime) -> tuple:
+                   ts_float: float) -> tuple:
         """
         Plan grid orders around ref_price
         
         Args:
             ref_price: Reference price for grid center
             spread_pct: Spread percentage between levels
-            timestamp: Current bar timestamp
+            ts_float: Current bar timestamp as unix epoch seconds
             
         Returns:
             Tuple of (grid_orders, kill_replace)
         """
+        log = self.logger
         grid_orders = []
         kill_replace = False
         
-        try:
-            # Check if we should kill and replace existing grid
-            if self._last_grid_ref_price is not None:
-                price_drift_pct = abs(ref_price - self._last_grid_ref_price) / self._last_grid_ref_price * 100
-                
-                if price_drift_pct > self.grid_kill_replace_threshold_pct:
-                    kill_replace = True
-                    self.logger.info(
-                        f"Grid kill_replace triggered: drift={price_drift_pct:.2f}% > "
-                        f"threshold={self.grid_kill_replace_threshold_pct}%"
-                    )
+        # Check if we should kill and replace existing grid
+        last_ref = self._last_grid_ref_price
+        if last_ref is not None:
+            # |diff| / last > frac, rewritten without abs() or a divide
+            diff = ref_price - last_ref
+            thr = last_ref * self._grid_kill_frac
             
-            # Check cooldown
-            if self._last_grid_timestamp is not None and not kill_replace:
-                elapsed = (timestamp - self._last_grid_timestamp).total_seconds()
-                if elapsed < self.grid_min_seconds_between:
-                    self.logger.debug(
-                        f"Grid cooldown active: {elapsed:.0f}s < {self.grid_min_seconds_between}s"
+            if diff > thr or -diff > thr:
+                kill_replace = True
+                log.info(
+                    "Grid kill_replace triggered: drift=%.2f%% > threshold=%s%%",
+                    abs(diff) / last_ref * 100, self.cfg.grid_kill_replace_threshold_pct
+                )
+        
+        # Check cooldown
+        if self._last_grid_ts_float is not None and not kill_replace:
+            elapsed = ts_float - self._last_grid_ts_float
+            if elapsed < self.cfg.grid_min_seconds_between:
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug(
+                        "Grid cooldown active: %.0fs < %ss",
+                        elapsed, self.cfg.grid_min_seconds_between
                     )
-                    return grid_orders, False
-            
-            # Generate grid levels
-            for i in range(1, self.grid_levels_per_side + 1):
-                # Buy orders below ref_price
-                buy_price = ref_price * (1 - (spread_pct / 100) * i)
-                grid_orders.append({
-                    'side': 'BUY',
-                    'price': buy_price,
-                    'tag': f'grid_buy_{i}'
-                })
-                
-                # Sell orders above ref_price
-                sell_price = ref_price * (1 + (spread_pct / 100) * i)
-                grid_orders.append({
-                    'side': 'SELL',
-                    'price': sell_price,
-                    'tag': f'grid_sell_{i}'
-                })
-            
-            # Update state
-            if grid_orders or kill_replace:
-                self._last_grid_ref_price = ref_price
-                self._last_grid_timestamp = timestamp
+                return grid_orders, False
+        
+        # Generate grid levels: all offsets in one vector op
+        offsets = self._grid_idx * (spread_pct * 0.01)
+        buy_prices = (ref_price * (1 - offsets)).tolist()
+        sell_prices = (ref_price * (1 + offsets)).tolist()
+        
+        for buy_price, sell_price, (buy_tag, sell_tag) in zip(
+            buy_prices, sell_prices, self._grid_tags
+        ):
+            # Buy orders below ref_price
+            grid_orders.append({
+                'side': SIDE_BUY,
+                'price': buy_price,
+                'tag': buy_tag
+            })
             
-            self.logger.debug(
-                f"Grid planned: {len(grid_orders)} orders, "
-                f"spread={spread_pct:.3f}%, kill_replace={kill_replace}"
+            # Sell orders above ref_price
+            grid_orders.append({
+                'side': SIDE_SELL,
+                'price': sell_price,
+                'tag': sell_tag
+            })
+        
+        # Update state
+        if grid_orders or kill_replace:
+            self._last_grid_ref_price = ref_price
+            self._last_grid_ts_float = ts_float
+            self._state_dict.update(
+                last_grid_ref_price=ref_price,
+                last_grid_timestamp=self._bar_timestamp
             )
         
-        except Exception as e:
-            self.logger.error(f"Error planning grid: {e}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Grid planned: %d orders, spread=%.3f%%, kill_replace=%s",
+                len(grid_orders), spread_pct, kill_replace
+            )
         
         return grid_orders, kill_replace
     
-    def _plan_dca(self, ref_price: float, signals: Dict, 
-                  timestamp: datetime) -> List[Dict]:
+    def _plan_dca(self, ref_price: float, signals: Signals, 
+                  ts_float: float) -> List[Dict]:
         """
         Plan DCA orders when oversold
         
         Args:
             ref_price: Current reference price
             signals: Technical signals
-            timestamp: Current bar timestamp
+            ts_float: Current bar timestamp as unix epoch seconds
             
         Returns:
             List of DCA orders
         """
+        log = self.logger
         dca_orders = []
         
-        try:
-            rsi = signals.get('rsi', 50.0)
-            ema_fast = signals.get('ema_fast', ref_price)
-            
-            # Check RSI threshold
-            if rsi >= self.dca_rsi_threshold:
-                return dca_orders
-            
-            # Optional EMA gate (price below EMA fast)
-            if self.dca_use_ema_gate and ref_price >= ema_fast:
-                return dca_orders
-            
-            # Check cooldown (bars)
-            if self._last_dca_timestamp is not None:
-                bars_elapsed = (timestamp - self._last_dca_timestamp).total_seconds() / self._bar_seconds
-                if bars_elapsed < self.dca_cooldown_bars:
-                    self.logger.debug(
-                        f"DCA cooldown active: {bars_elapsed:.1f} bars < {self.dca_cooldown_bars}"
+        rsi = signals.rsi
+        ema_fast = signals.ema_fast
+        
+        # Check RSI threshold
+        if rsi >= self.cfg.dca_rsi_threshold:
+            return dca_orders
+        
+        # Optional EMA gate (price below EMA fast)
+        if self.cfg.dca_use_ema_gate and ref_price >= ema_fast:
+            return dca_orders
+        
+        # Check cooldown (bars)
+        if self._last_dca_ts_float is not None:
+            elapsed = ts_float - self._last_dca_ts_float
+            if elapsed < self._dca_cooldown_seconds:
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug(
+                        "DCA cooldown active: %.1f bars < %s",
+                        elapsed / self._bar_seconds, self.cfg.dca_cooldown_bars
                     )
-                    return dca_orders
-            
-            # Check distance from last fill
-            if self._last_dca_fill_price is not None:
-                distance_pct = abs(ref_price - self._last_dca_fill_price) / self._last_dca_fill_price * 100
-                if distance_pct < self.dca_min_distance_from_last_fill_pct:
-                    self.logger.debug(
-                        f"DCA too close to last fill: {distance_pct:.2f}% < "
-                        f"{self.dca_min_distance_from_last_fill_pct}%"
+                return dca_orders
+        
+        # Check distance from last fill
+        last_fill = self._last_dca_fill_price
+        if last_fill is not None:
+            diff = ref_price - last_fill
+            thr = last_fill * self._dca_min_dist_frac
+            if diff < thr and -diff < thr:
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug(
+                        "DCA too close to last fill: %.2f%% < %s%%",
+                        abs(diff) / last_fill * 100,
+                        self.cfg.dca_min_distance_from_last_fill_pct
                     )
-                    return dca_orders
-            
-            # Create DCA buy order slightly below ref_price
-            dca_price = ref_price * (1 - self.dca_price_offset_pct / 100)
-            
-            dca_orders.append({
-                'side': 'BUY',
-                'price': dca_price,
-                'tag': f'dca_rsi{rsi:.0f}'
-            })
-            
-            # Update state
-            self._last_dca_timestamp = timestamp
-            
-            self.logger.info(
-                f"DCA triggered: RSI={rsi:.1f}, price={dca_price:.2f}"
-            )
+                return dca_orders
         
-        except Exception as e:
-            self.logger.error(f"Error planning DCA: {e}")
+        # Create DCA buy order slightly below ref_price
+        dca_price = ref_price * self._dca_price_mult
+        
+        dca_orders.append({
+            'side': SIDE_BUY,
+            'price': dca_price,
+            'tag': (self._dca_tags[round(rsi)] if 0 < rsi <= 100
+                    else f'dca_rsi{rsi:.0f}')
+        })
+        
+        # Update state
+        self._last_dca_ts_float = ts_float
+        self._state_dict['last_dca_timestamp'] = self._bar_timestamp
+        
+        log.info(
+            "DCA triggered: RSI=%.1f, price=%.2f", rsi, dca_price
+        )
         
         return dca_orders
     
-    def _plan_tp(self, ref_price: float, signals: Dict, band: str) -> List[Dict]:
+    def _plan_tp(self, ref_price: float, signals: Signals, band_idx: int) -> List[Dict]:
         """
         Plan TP (take profit) orders when overbought
         
         Args:
             ref_price: Current reference price
             signals: Technical signals
-            band: Current volatility band
+            band_idx: Current volatility band code (index into BAND_NAMES)
             
         Returns:
             List of TP orders (suggestions for trailing)
         """
         tp_orders = []
         
-        try:
-            rsi = signals.get('rsi', 50.0)
-            ema_fast = signals.get('ema_fast', ref_price)
-            
-            # Check overbought condition
-            if rsi < self.tp_rsi_threshold:
-                return tp_orders
-            
-            # Price should be above EMA fast
-            if ref_price < ema_fast:
-                return tp_orders
-            
-            # Determine TP spread based on band
-            if band == "near":
-                tp_spread = self.tp_spread_near_pct
-            elif band == "mid":
-                tp_spread = self.tp_spread_mid_pct
-            else:  # far
-                tp_spread = self.tp_spread_far_pct
-            
-            # Create TP sell order above ref_price
-            tp_price = ref_price * (1 + tp_spread / 100)
-            
-            tp_orders.append({
-                'side': 'SELL',
-                'price': tp_price,
-                'tag': f'tp_rsi{rsi:.0f}_band{band}'
-            })
-            
-            self.logger.info(
-                f"TP triggered: RSI={rsi:.1f}, band={band}, price={tp_price:.2f}"
-            )
+        rsi = signals.rsi
+        ema_fast = signals.ema_fast
         
-        except Exception as e:
-            self.logger.error(f"Error planning TP: {e}")
+        # Check overbought condition
+        if rsi < self.cfg.tp_rsi_threshold:
+            return tp_orders
+        
+        # Price should be above EMA fast
+        if ref_price < ema_fast:
+            return tp_orders
+        
+        # Determine TP multiplier based on band
+        tp_mult = self._tp_mult_by_band[band_idx]
+        
+        # Create TP sell order above ref_price
+        tp_price = ref_price * tp_mult
+        
+        tp_orders.append({
+            'side': SIDE_SELL,
+            'price': tp_price,
+            'tag': (self._tp_tags[band_idx][round(rsi)] if 0 < rsi <= 100
+                    else f'tp_rsi{rsi:.0f}_band{BAND_NAMES[band_idx]}')
+        })
+        
+        self.logger.info(
+            "TP triggered: RSI=%.1f, band=%s, price=%.2f",
+            rsi, BAND_NAMES[band_idx], tp_price
+        )
         
         return tp_orders
     
     def _evaluate_gate_and_sl(self, bar: Dict, equity: float, 
-                              ref_price: float) -> tuple:
+                              ref_price: float, ts_float: float,
+                              signals: Signals) -> tuple:
         """
         Evaluate PnL Gate state and Stop-Loss action
         
@@ -520,103 +857,109 @@ class HybridStrategyEngine:
             bar: Current bar with timestamp
             equity: Current portfolio equity
             ref_price: Current reference price
+            ts_float: Current bar timestamp as unix epoch seconds
+            signals: Validated technical signals (used for auto-resume)
             
         Returns:
             Tuple of (gate_state, sl_action)
         """
-        gate_state = "RUN"
+        log = self.logger
+        gate_state = GATE_RUN
         sl_action = {"stop": False}
         
-        try:
-            timestamp = bar['timestamp']
+        timestamp = bar['timestamp']
+        date_ordinal = timestamp.toordinal()
+        
+        # Same price, equity and day as a previous non-stopped evaluation
+        # (duplicate ticks, replayed bars) gives the same gate state; only the
+        # state is cached so each plan gets its own sl_action dict
+        cache_key = (ref_price, equity, date_ordinal)
+        if not self._hard_stop_active and cache_key == self._gate_cache_key:
+            return self._gate_cache_val, {"stop": False}
+        
+        # Reset daily tracking on new day (int compare; date string built once per day)
+        if self._last_date_ordinal != date_ordinal:
             current_date = timestamp.strftime('%Y-%m-%d')
-            
-            # Reset daily tracking on new day
-            if self._last_date != current_date:
-                self._open_price_day = ref_price
-                self._equity_open = equity
-                self._last_date = current_date
-                self.logger.info(
-                    f"New trading day: date={current_date}, "
-                    f"open_price={ref_price:.2f}, equity={equity:.2f}"
-                )
-            
-            # Calculate Gap% (price vs open price)
-            if self._open_price_day is not None and self._open_price_day > 0:
-                gap_pct = ((ref_price - self._open_price_day) / self._open_price_day) * 100
-            else:
-                gap_pct = 0.0
-            
-            # Calculate Daily PnL%
-            if self._equity_open is not None and self._equity_open > 0:
-                daily_pnl_pct = ((equity - self._equity_open) / self._equity_open) * 100
-            else:
-                daily_pnl_pct = 0.0
-            
-            # Check if we're in hard stop state
-            if self._hard_stop_active:
-                # Check if we can resume
-                if self.auto_resume_enabled and self._can_resume(bar, ref_price):
-                    self.logger.warning(
-                        f"Auto-resume triggered: Good market signal detected. "
-                        f"Resuming trading from hard stop."
-                    )
-                    self._hard_stop_active = False
-                    self._hard_stop_timestamp = None
-                    self._hard_stop_price = None
-                    self._hard_stop_reason = None
-                    # Continue to normal gate evaluation
-                else:
-                    # Still in hard stop
-                    sl_action = {
-                        "stop": True,
-                        "reason": f"Hard stop active: {self._hard_stop_reason}"
-                    }
-                    return "PAUSED", sl_action
-            
-            # Check hard stop conditions (if not already stopped)
-            if daily_pnl_pct <= self.hard_stop_daily_pnl_pct:
-                self._activate_hard_stop(
-                    timestamp=timestamp,
-                    price=ref_price,
-                    reason=f"Daily PnL {daily_pnl_pct:.2f}% <= {self.hard_stop_daily_pnl_pct}%"
+            self._open_price_day = ref_price
+            self._equity_open = equity
+            self._last_date = current_date
+            self._state_dict.update(
+                open_price_day=ref_price, equity_open=equity, last_date=current_date
+            )
+            self._last_date_ordinal = date_ordinal
+            log.info(
+                f"New trading day: date={current_date}, "
+                f"open_price={ref_price:.2f}, equity={equity:.2f}"
+            )
+        
+        # Calculate Gap% (price vs open price) and Daily PnL%
+        gap = _frac_change(ref_price, self._open_price_day)
+        daily_pnl = _frac_change(equity, self._equity_open)
+        
+        # Check if we're in hard stop state
+        if self._hard_stop_active:
+            # Check if we can resume
+            if self.cfg.auto_resume_enabled and self._can_resume(ref_price, ts_float, signals):
+                log.warning(
+                    f"Auto-resume triggered: Good market signal detected. "
+                    f"Resuming trading from hard stop."
                 )
-                sl_action = {
-                    "stop": True,
-                    "reason": self._hard_stop_reason
-                }
-                return "PAUSED", sl_action
-            
-            if gap_pct <= self.hard_stop_gap_pct:
-                self._activate_hard_stop(
-                    timestamp=timestamp,
-                    price=ref_price,
-                    reason=f"Gap {gap_pct:.2f}% <= {self.hard_stop_gap_pct}%"
+                self._hard_stop_active = False
+                self._hard_stop_timestamp = None
+                self._hard_stop_ts_float = None
+                self._hard_stop_price = None
+                self._hard_stop_reason = None
+                self._state_dict.update(
+                    hard_stop_active=False, hard_stop_timestamp=None,
+                    hard_stop_price=None, hard_stop_reason=None
                 )
+                # Continue to normal gate evaluation
+            else:
+                # Still in hard stop
                 sl_action = {
                     "stop": True,
-                    "reason": self._hard_stop_reason
+                    "reason": f"Hard stop active: {self._hard_stop_reason}"
                 }
-                return "PAUSED", sl_action
-            
-            # Determine gate state
-            if (daily_pnl_pct <= self.gate_paused_daily_pnl_pct or 
-                gap_pct <= self.gate_paused_gap_pct):
-                gate_state = "PAUSED"
-            elif (daily_pnl_pct <= self.gate_degraded_daily_pnl_pct or 
-                  gap_pct <= self.gate_degraded_gap_pct):
-                gate_state = "DEGRADED"
-            else:
-                gate_state = "RUN"
-            
-            self.logger.debug(
-                f"Gate evaluation: state={gate_state}, "
-                f"gap={gap_pct:.2f}%, daily_pnl={daily_pnl_pct:.2f}%"
+                return GATE_PAUSED, sl_action
+        
+        # Check hard stop conditions (if not already stopped)
+        if daily_pnl <= self._hard_stop_daily_frac:
+            self._activate_hard_stop(
+                timestamp=timestamp,
+                ts_float=ts_float,
+                price=ref_price,
+                reason=f"Daily PnL {daily_pnl * 100:.2f}% <= {self.cfg.hard_stop_daily_pnl_pct}%"
             )
+            sl_action = {
+                "stop": True,
+                "reason": self._hard_stop_reason
+            }
+            return GATE_PAUSED, sl_action
         
-        except Exception as e:
-            self.logger.error(f"Error evaluating gate and SL: {e}")
+        if gap <= self._hard_stop_gap_frac:
+            self._activate_hard_stop(
+                timestamp=timestamp,
+                ts_float=ts_float,
+                price=ref_price,
+                reason=f"Gap {gap * 100:.2f}% <= {self.cfg.hard_stop_gap_pct}%"
+            )
+            sl_action = {
+                "stop": True,
+                "reason": self._hard_stop_reason
+            }
+            return GATE_PAUSED, sl_action
+        
+        # Determine gate state
+        gate_state = _gate_state(daily_pnl, gap, self._gate_fracs)
+        
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Gate evaluation: state=%s, gap=%.2f%%, daily_pnl=%.2f%%",
+                gate_state, gap * 100, daily_pnl * 100
+            )
         
+        self._gate_cache_key = cache_key
+        self._gate_cache_val = gate_state
         return gate_state, sl_action
     
     def notify_dca_fill(self, fill_price: float):
@@ -627,27 +970,36 @@ class HybridStrategyEngine:
             fill_price: Price at which DCA order was filled
         """
         self._last_dca_fill_price = fill_price
+        self._state_dict['last_dca_fill_price'] = fill_price
         self.logger.info(f"DCA fill recorded at {fill_price:.2f}")
     
-    def _activate_hard_stop(self, timestamp: datetime, price: float, reason: str):
+    def _activate_hard_stop(self, timestamp: datetime, ts_float: float,
+                            price: float, reason: str):
         """
         Activate hard stop
         
         Args:
             timestamp: Time when hard stop triggered
+            ts_float: Same time as unix epoch seconds (resume cooldown baseline)
             price: Price when hard stop triggered
             reason: Reason for hard stop
         """
         self._hard_stop_active = True
         self._hard_stop_timestamp = timestamp
+        self._hard_stop_ts_float = ts_float
         self._hard_stop_price = price
         self._hard_stop_reason = reason
+        self._state_dict.update(
+            hard_stop_active=True, hard_stop_timestamp=timestamp,
+            hard_stop_price=price, hard_stop_reason=reason
+        )
         
         self.logger.critical(
             f"Hard stop activated: {reason} at price=${price:.2f}"
         )
     
-    def _can_resume(self, bar: Dict, current_price: float) -> bool:
+    def _can_resume(self, current_price: float, ts_float: float,
+                    signals: Signals) -> bool:
         """
         Check if trading can resume after hard stop
         
@@ -657,81 +1009,62 @@ class HybridStrategyEngine:
         3. Price recovered by X% from stop price (default 2%)
         
         Args:
-            bar: Current bar with timestamp and indicators
             current_price: Current market price
+            ts_float: Current bar timestamp as unix epoch seconds
+            signals: Validated technical signals
             
         Returns:
             True if can resume, False otherwise
         """
-        if not self._hard_stop_active or self._hard_stop_timestamp is None:
+        if not self._hard_stop_active or self._hard_stop_ts_float is None:
             return False
         
-        try:
-            # Get signals
-            signals = self.indicator_engine.latest()
-            if not signals:
-                return False
-            
-            # Check cooldown period
-            timestamp = bar['timestamp']
-            bars_since_stop = (timestamp - self._hard_stop_timestamp).total_seconds() / self._bar_seconds
-            
-            if bars_since_stop < self.resume_cooldown_bars:
+        # Check cooldown period
+        since_stop = ts_float - self._hard_stop_ts_float
+        
+        if since_stop < self._resume_cooldown_seconds:
+            if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(
-                    f"Resume cooldown: {bars_since_stop:.0f}/{self.resume_cooldown_bars} bars"
+                    "Resume cooldown: %.0f/%s bars",
+                    since_stop / self._bar_seconds, self.cfg.resume_cooldown_bars
                 )
-                return False
-            
-            # Check RSI recovery
-            rsi = signals.get('rsi', 50)
-            if rsi <= self.resume_rsi_threshold:
+            return False
+        
+        # Check RSI recovery
+        rsi = signals.rsi
+        if rsi <= self.cfg.resume_rsi_threshold:
+            if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(
-                    f"Resume RSI check: {rsi:.1f} <= {self.resume_rsi_threshold}"
+                    "Resume RSI check: %.1f <= %s", rsi, self.cfg.resume_rsi_threshold
                 )
-                return False
-            
-            # Check price recovery
-            if self._hard_stop_price is not None and self._hard_stop_price > 0:
-                price_change_pct = ((current_price - self._hard_stop_price) / self._hard_stop_price) * 100
-                
-                if price_change_pct < self.resume_price_recovery_pct:
+            return False
+        
+        # Check price recovery
+        stop_price = self._hard_stop_price
+        if stop_price is not None and stop_price > 0:
+            if current_price - stop_price < stop_price * self._resume_recovery_frac:
+                if self.logger.isEnabledFor(logging.DEBUG):
                     self.logger.debug(
-                        f"Resume price check: {price_change_pct:+.2f}% < {self.resume_price_recovery_pct}%"
+                        "Resume price check: %+.2f%% < %s%%",
+                        (current_price - stop_price) / stop_price * 100,
+                        self.cfg.resume_price_recovery_pct
                     )
-                    return False
-            
-            # All conditions met
-            self.logger.info(
-                f"Resume conditions met: "
-                f"cooldown={bars_since_stop:.0f} bars, "
-                f"RSI={rsi:.1f}, "
-                f"price_recovery={price_change_pct:+.2f}%"
-            )
-            return True
+                return False
         
-        except Exception as e:
-            self.logger.error(f"Error checking resume conditions: {e}")
-            return False
+        # All conditions met
+        self.logger.info(
+            f"Resume conditions met: "
+            f"cooldown={since_stop / self._bar_seconds:.0f} bars, "
+            f"RSI={rsi:.1f}, "
+            f"price_recovery={_frac_change(current_price, stop_price) * 100:+.2f}%"
+        )
+        return True
     
     def get_state(self) -> Dict:
         """
         Get current engine state
         
         Returns:
-            Dictionary with state information
+            Dictionary with state information (a copy of the cached snapshot)
         """
-        return {
-            'symbol': self.symbol,
-            'last_grid_ref_price': self._last_grid_ref_price,
-            'last_grid_timestamp': self._last_grid_timestamp,
-            'last_dca_timestamp': self._last_dca_timestamp,
-            'last_dca_fill_price': self._last_dca_fill_price,
-            'open_price_day': self._open_price_day,
-            'equity_open': self._equity_open,
-            'last_date': self._last_date,
-            'hard_stop_active': self._hard_stop_active,
-            'hard_stop_timestamp': self._hard_stop_timestamp,
-            'hard_stop_price': self._hard_stop_price,
-            'hard_stop_reason': self._hard_stop_reason
-        }
-
+        return self._state_dict.copy()
@@ -2,7 +2,7 @@
 Utility modules
 """
 from .logger import TradingLogger, log_trade, log_order, log_pnl
-from .config import Config, config
+from .config import Config, RiskLimits, config
 from .trade_exporter import TradeExporter
 from .order_logger import OrderLogger
 
@@ -12,6 +12,7 @@ __all__ = [
     'log_order', 
     'log_pnl', 
     'Config', 
+    'RiskLimits',
     'config',
     'TradeExporter',
     'OrderLogger'
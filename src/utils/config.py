@@ -2,11 +2,72 @@
 Configuration management for the trading bot
 """
 import os
+import copy
 import yaml
+from dataclasses import dataclass, asdict
 from typing import Dict, Any
 from dotenv import load_dotenv
 
 
+# Parsed YAML files keyed by (path, mtime); re-parsed only when the file changes
+_YAML_CACHE: Dict[tuple, Any] = {}
+
+_MISSING = object()
+
+
+def _load_yaml(file_path: str) -> Any:
+    """
+    Load a YAML file, reusing the parsed result while the file is unchanged
+    
+    Args:
+        file_path: Path to YAML file
+        
+    Returns:
+        Parsed YAML data (a private deep copy; the cached parse is never
+        handed out, so callers may mutate the result)
+    """
+    key = (os.path.abspath(file_path), os.path.getmtime(file_path))
+    if key not in _YAML_CACHE:
+        with open(file_path, 'r') as f:
+            _YAML_CACHE[key] = yaml.safe_load(f)
+    return copy.deepcopy(_YAML_CACHE[key])
+
+
+def _flatten(data: Dict, prefix: str = '', out: Dict = None) -> Dict:
+    """
+    Flatten nested dicts into dot-path keys (intermediate dicts are kept too)
+    
+    Args:
+        data: Nested configuration dict
+        prefix: Dot-path prefix for keys of data
+        out: Dict to fill
+        
+    Returns:
+        Dict mapping 'a.b.c' style keys to values
+    """
+    if out is None:
+        out = {}
+    for k, v in data.items():
+        path = f"{prefix}{k}"
+        out[path] = v
+        if isinstance(v, dict):
+            _flatten(v, f"{path}.", out)
+    return out
+
+
+@dataclass(frozen=True, slots=True)
+class RiskLimits:
+    """
+    Risk management limits, resolved once from env and risk config
+    """
+    max_risk_per_trade: float
+    max_daily_loss: float
+    max_weekly_loss: float
+    min_cash_reserve: float
+    max_positions: int
+    max_strategies_per_pair: int
+
+
 class Config:
     """Configuration manager"""
     
@@ -22,9 +83,12 @@ class Config:
         
         self.config_dir = config_dir
         self._config = {}
+        self._flat = {}
+        self._risk_limits = None
         
-        # Load environment variables
+        # Load environment variables and snapshot them for get_env
         load_dotenv()
+        self._env = dict(os.environ)
         
         # Load configuration files
         self._load_configs()
@@ -36,10 +100,22 @@ class Config:
         for config_file in config_files:
             file_path = os.path.join(self.config_dir, config_file)
             if os.path.exists(file_path):
-                with open(file_path, 'r') as f:
-                    config_data = yaml.safe_load(f)
-                    if config_data:
-                        self._config.update(config_data)
+                config_data = _load_yaml(file_path)
+                if config_data:
+                    self._config.update(config_data)
+        
+        # Dot-path index so get() is a single dict lookup
+        self._flat = _flatten(self._config)
+        
+        # Built on first use so a bad MAX_* value only fails risk code
+        self._risk_limits = None
+    
+    def reload(self):
+        """Reload environment and configuration files (YAML re-parsed only if changed)"""
+        load_dotenv()
+        self._env = dict(os.environ)
+        self._config = {}
+        self._load_configs()
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -52,20 +128,12 @@ class Config:
         Returns:
             Configuration value
         """
-        keys = key.split('.')
-        value = self._config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
+        value = self._flat.get(key, _MISSING)
+        return default if value is _MISSING else value
     
     def get_env(self, key: str, default: Any = None) -> Any:
         """
-        Get environment variable
+        Get environment variable (from the snapshot taken at load time)
         
         Args:
             key: Environment variable name
@@ -74,7 +142,7 @@ class Config:
         Returns:
             Environment variable value
         """
-        return os.getenv(key, default)
+        return self._env.get(key, default)
     
     def get_trading_mode(self) -> str:
         """
@@ -114,25 +182,41 @@ class Config:
                 'testnet': False
             }
     
+    @property
+    def risk_limits(self) -> RiskLimits:
+        """Risk limits, resolved on first access and cached until reload()"""
+        if self._risk_limits is None:
+            self._risk_limits = self._build_risk_limits()
+        return self._risk_limits
+    
+    def _build_risk_limits(self) -> RiskLimits:
+        """
+        Resolve risk limits from env (takes precedence) and risk config
+        
+        Returns:
+            RiskLimits instance
+        """
+        return RiskLimits(
+            max_risk_per_trade=float(self.get_env('MAX_RISK_PER_TRADE', 
+                                     self.get('risk.max_risk_per_trade', 0.005))),
+            max_daily_loss=float(self.get_env('MAX_DAILY_LOSS',
+                                 self.get('risk.max_daily_loss', 0.02))),
+            max_weekly_loss=float(self.get_env('MAX_WEEKLY_LOSS',
+                                  self.get('risk.max_weekly_loss', 0.05))),
+            min_cash_reserve=float(self.get_env('MIN_CASH_RESERVE',
+                                   self.get('risk.min_cash_reserve', 0.30))),
+            max_positions=int(self.get('risk.max_positions', 7)),
+            max_strategies_per_pair=int(self.get('risk.max_strategies_per_pair', 2))
+        )
+    
     def get_risk_limits(self) -> Dict[str, float]:
         """
         Get risk management limits
         
         Returns:
-            Dictionary with risk limits
-        """
-        return {
-            'max_risk_per_trade': float(self.get_env('MAX_RISK_PER_TRADE', 
-                                        self.get('risk.max_risk_per_trade', 0.005))),
-            'max_daily_loss': float(self.get_env('MAX_DAILY_LOSS',
-                                    self.get('risk.max_daily_loss', 0.02))),
-            'max_weekly_loss': float(self.get_env('MAX_WEEKLY_LOSS',
-                                     self.get('risk.max_weekly_loss', 0.05))),
-            'min_cash_reserve': float(self.get_env('MIN_CASH_RESERVE',
-                                      self.get('risk.min_cash_reserve', 0.30))),
-            'max_positions': int(self.get('risk.max_positions', 7)),
-            'max_strategies_per_pair': int(self.get('risk.max_strategies_per_pair', 2))
-        }
+            Dictionary with risk limits (see the risk_limits attribute)
+        """
+        return asdict(self.risk_limits)
     
     def get_strategy_config(self, strategy_name: str) -> Dict[str, Any]:
         """
@@ -4,6 +4,8 @@ Enhanced Console Logger with Colors
 Provides colored console output for better visibility of trading activities.
 """
 import logging
+import os
+import sys
 from datetime import datetime
 from typing import Optional
 
@@ -36,6 +38,40 @@ class Colors:
     BG_GREEN = '\033[42m'
     BG_YELLOW = '\033[43m'
     BG_BLUE = '\033[44m'
+    
+    # Bold combinations (precomputed instead of concatenated per call)
+    BOLD_RED = BOLD + RED
+    BOLD_WHITE = BOLD + WHITE
+    BOLD_BLUE = BOLD + BLUE
+    BOLD_CYAN = BOLD + CYAN
+    BOLD_BRIGHT_RED = BOLD + BRIGHT_RED
+    BOLD_BRIGHT_GREEN = BOLD + BRIGHT_GREEN
+    BOLD_BRIGHT_YELLOW = BOLD + BRIGHT_YELLOW
+    BOLD_BRIGHT_CYAN = BOLD + BRIGHT_CYAN
+    BOLD_ALERT = BOLD + BG_RED + WHITE
+
+
+# Order type and band colors (looked up per call, built once)
+ORDER_TYPE_COLORS = {
+    'GRID': Colors.CYAN,
+    'DCA': Colors.YELLOW,
+    'TP': Colors.MAGENTA,
+    'SL': Colors.RED
+}
+BAND_COLORS = {
+    'near': Colors.GREEN,
+    'mid': Colors.YELLOW,
+    'far': Colors.RED
+}
+
+
+def _terminal_supports_color() -> bool:
+    """True unless NO_COLOR is set or the console stream is not a terminal"""
+    if os.environ.get('NO_COLOR') is not None:
+        return False
+    # The logging StreamHandler writes to stderr
+    stream = sys.stderr
+    return stream is not None and hasattr(stream, 'isatty') and stream.isatty()
 
 
 class ConsoleLogger:
@@ -43,16 +79,59 @@ class ConsoleLogger:
     Enhanced console logger with colored output
     """
     
+    # enable_colors -> prebuilt segments (see _build_segments)
+    _segments_cache = {}
+    
     def __init__(self, logger: logging.Logger, enable_colors: bool = True):
         """
         Initialize ConsoleLogger
         
         Args:
             logger: Base logger instance
-            enable_colors: Enable colored output
+            enable_colors: Enable colored output (ignored when the console is
+                not a terminal or NO_COLOR is set)
         """
         self.logger = logger
-        self.enable_colors = enable_colors
+        self.enable_colors = enable_colors and _terminal_supports_color()
+        
+        # Fixed colorized segments, built once per color setting and shared
+        # by every ConsoleLogger
+        segments = ConsoleLogger._segments_cache.get(self.enable_colors)
+        if segments is None:
+            segments = self._build_segments()
+            ConsoleLogger._segments_cache[self.enable_colors] = segments
+        (self._header_line, self._section_line, self._side_labels,
+         self._placed_type_labels, self._filled_type_labels) = segments
+    
+    def _build_segments(self) -> tuple:
+        """Colorize the fixed header/section lines and side/type labels"""
+        header_line = self._colorize("=" * 80, Colors.CYAN)
+        section_line = self._colorize("-" * 80, Colors.BLUE)
+        side_labels = {
+            'BUY': self._colorize('BUY', Colors.BOLD_BRIGHT_GREEN),
+            'SELL': self._colorize('SELL', Colors.BOLD_BRIGHT_RED)
+        }
+        placed_type_labels = {
+            order_type: self._colorize(order_type, Colors.BOLD + color)
+            for order_type, color in ORDER_TYPE_COLORS.items()
+        }
+        filled_type_labels = {
+            order_type: self._colorize(order_type, Colors.BOLD_CYAN)
+            for order_type in ORDER_TYPE_COLORS
+        }
+        return (header_line, section_line, side_labels,
+                placed_type_labels, filled_type_labels)
+    
+    def _enabled(self, level: int) -> bool:
+        """Check if a message at level would be emitted (skip formatting otherwise)"""
+        return self.logger.isEnabledFor(level)
+    
+    def _side_label(self, side: str) -> str:
+        """Colored side label (green for BUY, red otherwise)"""
+        label = self._side_labels.get(side)
+        if label is None:
+            label = self._colorize(side, Colors.BOLD_BRIGHT_RED)
+        return label
     
     def _colorize(self, text: str, color: str) -> str:
         """Apply color to text"""
@@ -62,58 +141,67 @@ class ConsoleLogger:
     
     def print_header(self, text: str):
         """Print a header line"""
-        line = "=" * 80
-        self.logger.info(self._colorize(line, Colors.CYAN))
-        self.logger.info(self._colorize(f"  {text}", Colors.BOLD + Colors.CYAN))
-        self.logger.info(self._colorize(line, Colors.CYAN))
+        if not self._enabled(logging.INFO):
+            return
+        
+        self.logger.info(self._header_line)
+        self.logger.info(self._colorize(f"  {text}", Colors.BOLD_CYAN))
+        self.logger.info(self._header_line)
     
     def print_section(self, text: str):
         """Print a section divider"""
-        line = "-" * 80
-        self.logger.info(self._colorize(line, Colors.BLUE))
-        self.logger.info(self._colorize(f"  {text}", Colors.BOLD + Colors.BLUE))
-        self.logger.info(self._colorize(line, Colors.BLUE))
+        if not self._enabled(logging.INFO):
+            return
+        
+        self.logger.info(self._section_line)
+        self.logger.info(self._colorize(f"  {text}", Colors.BOLD_BLUE))
+        self.logger.info(self._section_line)
     
     def print_equity(self, equity: float, cash: float, position_value: float):
         """Print equity information"""
+        if not self._enabled(logging.INFO):
+            return
+        
         text = (
             f"💰 EQUITY: ${equity:,.2f}  |  "
             f"Cash: ${cash:,.2f}  |  "
             f"Position: ${position_value:,.2f}"
         )
-        self.logger.info(self._colorize(text, Colors.BOLD + Colors.BRIGHT_CYAN))
+        self.logger.info(self._colorize(text, Colors.BOLD_BRIGHT_CYAN))
     
     def print_pnl_state(self, state: str, daily_pnl: Optional[float] = None, 
                        gap_pnl: Optional[float] = None):
         """Print PnL Gate state"""
+        if not self._enabled(logging.INFO):
+            return
+        
         if state == "RUN":
-            color = Colors.BRIGHT_GREEN
+            color = Colors.BOLD_BRIGHT_GREEN
             icon = "✓"
         elif state == "DEGRADED":
-            color = Colors.BRIGHT_YELLOW
+            color = Colors.BOLD_BRIGHT_YELLOW
             icon = "⚠"
         else:  # PAUSED
-            color = Colors.BRIGHT_RED
+            color = Colors.BOLD_BRIGHT_RED
             icon = "⏸"
         
-        text = f"{icon} PnL State: {state}"
+        parts = [f"{icon} PnL State: {state}"]
         
         if daily_pnl is not None:
-            text += f"  |  Daily PnL: {daily_pnl:+.2f}%"
+            parts.append(f"Daily PnL: {daily_pnl:+.2f}%")
         
         if gap_pnl is not None:
-            text += f"  |  Gap PnL: {gap_pnl:+.2f}%"
+            parts.append(f"Gap PnL: {gap_pnl:+.2f}%")
         
-        self.logger.info(self._colorize(text, Colors.BOLD + color))
+        self.logger.info(self._colorize("  |  ".join(parts), color))
     
     def print_order_plan(self, symbol: str, band: str, spread_pct: float,
                         grid_count: int, dca_count: int, tp_count: int):
         """Print order plan summary"""
-        band_color = {
-            'near': Colors.GREEN,
-            'mid': Colors.YELLOW,
-            'far': Colors.RED
-        }.get(band, Colors.WHITE)
+        if not self._enabled(logging.INFO):
+            return
+        
+        band_color = BAND_COLORS.get(band, Colors.WHITE)
         
         text = (
             f"📊 {symbol} Plan: "
@@ -127,72 +215,68 @@ class ConsoleLogger:
                           qty: float, price: float, tag: str = "",
                           order_id: Optional[str] = None):
         """Print order placement"""
-        # Color based on side
-        if side == "BUY":
-            side_color = Colors.BRIGHT_GREEN
-            icon = "📈"
-        else:  # SELL
-            side_color = Colors.BRIGHT_RED
-            icon = "📉"
-        
-        # Color based on order type
-        type_colors = {
-            'GRID': Colors.CYAN,
-            'DCA': Colors.YELLOW,
-            'TP': Colors.MAGENTA,
-            'SL': Colors.RED
-        }
-        type_color = type_colors.get(order_type, Colors.WHITE)
+        if not self._enabled(logging.INFO):
+            return
         
-        text = (
+        # Icon based on side
+        icon = "📈" if side == "BUY" else "📉"
+        
+        # Pre-colored labels for known types/sides
+        type_label = self._placed_type_labels.get(order_type)
+        if type_label is None:
+            type_label = self._colorize(order_type, Colors.BOLD_WHITE)
+        
+        parts = [
             f"{icon} ORDER PLACED: "
-            f"{self._colorize(order_type, Colors.BOLD + type_color)} | "
-            f"{self._colorize(side, Colors.BOLD + side_color)} "
+            f"{type_label} | "
+            f"{self._side_label(side)} "
             f"{qty:.6f} {symbol} @ ${price:.2f}"
-        )
+        ]
         
         if tag:
-            text += f"  [{tag}]"
+            parts.append(f"[{tag}]")
         
         if order_id:
-            text += f"  (ID: {order_id})"
+            parts.append(f"(ID: {order_id})")
         
-        self.logger.info(text)
+        self.logger.info("  ".join(parts))
     
     def print_order_filled(self, order_type: str, side: str, symbol: str,
                           qty: float, price: float, pnl: Optional[float] = None,
                           tag: str = ""):
         """Print order fill"""
-        # Color based on side
-        if side == "BUY":
-            side_color = Colors.BRIGHT_GREEN
-            icon = "✅"
-        else:  # SELL
-            side_color = Colors.BRIGHT_RED
-            icon = "✅"
+        if not self._enabled(logging.INFO):
+            return
         
-        text = (
-            f"{icon} ORDER FILLED: "
-            f"{self._colorize(order_type, Colors.BOLD + Colors.CYAN)} | "
-            f"{self._colorize(side, Colors.BOLD + side_color)} "
+        type_label = self._filled_type_labels.get(order_type)
+        if type_label is None:
+            type_label = self._colorize(order_type, Colors.BOLD_CYAN)
+        
+        parts = [
+            f"✅ ORDER FILLED: "
+            f"{type_label} | "
+            f"{self._side_label(side)} "
             f"{qty:.6f} {symbol} @ ${price:.2f}"
-        )
+        ]
         
         if tag:
-            text += f"  [{tag}]"
+            parts.append(f"[{tag}]")
         
         if pnl is not None:
             pnl_color = Colors.BRIGHT_GREEN if pnl >= 0 else Colors.BRIGHT_RED
-            text += f"  PnL: {self._colorize(f'{pnl:+.2f}', pnl_color)}"
+            parts.append(f"PnL: {self._colorize(f'{pnl:+.2f}', pnl_color)}")
         
-        self.logger.info(text)
+        self.logger.info("  ".join(parts))
     
     def print_order_rejected(self, order_type: str, side: str, symbol: str,
                            price: float, reason: str):
         """Print order rejection"""
+        if not self._enabled(logging.WARNING):
+            return
+        
         text = (
             f"❌ ORDER REJECTED: "
-            f"{self._colorize(order_type, Colors.BOLD + Colors.RED)} | "
+            f"{self._colorize(order_type, Colors.BOLD_RED)} | "
             f"{side} {symbol} @ ${price:.2f}  "
             f"Reason: {reason}"
         )
@@ -202,6 +286,9 @@ class ConsoleLogger:
                       current_price: float, unrealized_pnl: float,
                       unrealized_pnl_pct: float):
         """Print position status"""
+        if not self._enabled(logging.INFO):
+            return
+        
         pnl_color = Colors.BRIGHT_GREEN if unrealized_pnl >= 0 else Colors.BRIGHT_RED
         
         text = (
@@ -216,33 +303,51 @@ class ConsoleLogger:
     
     def print_hard_stop(self, symbol: str, reason: str):
         """Print hard stop alert"""
+        if not self._enabled(logging.CRITICAL):
+            return
+        
         text = (
             f"🛑 HARD STOP TRIGGERED: {symbol}  |  "
             f"Reason: {reason}"
         )
-        self.logger.critical(self._colorize(text, Colors.BOLD + Colors.BG_RED + Colors.WHITE))
+        self.logger.critical(self._colorize(text, Colors.BOLD_ALERT))
     
     def print_auto_resume(self, symbol: str, reason: str):
         """Print auto-resume notification"""
+        if not self._enabled(logging.INFO):
+            return
+        
         text = (
             f"🔄 AUTO-RESUME: {symbol}  |  "
             f"Reason: {reason}"
         )
-        self.logger.info(self._colorize(text, Colors.BOLD + Colors.BRIGHT_GREEN))
+        self.logger.info(self._colorize(text, Colors.BOLD_BRIGHT_GREEN))
     
     def print_warning(self, message: str):
         """Print warning message"""
+        if not self._enabled(logging.WARNING):
+            return
+        
         self.logger.warning(self._colorize(f"⚠️  {message}", Colors.BRIGHT_YELLOW))
     
     def print_error(self, message: str):
         """Print error message"""
+        if not self._enabled(logging.ERROR):
+            return
+        
         self.logger.error(self._colorize(f"❌ {message}", Colors.BRIGHT_RED))
     
     def print_success(self, message: str):
         """Print success message"""
+        if not self._enabled(logging.INFO):
+            return
+        
         self.logger.info(self._colorize(f"✓ {message}", Colors.BRIGHT_GREEN))
     
     def print_info(self, message: str):
         """Print info message"""
+        if not self._enabled(logging.INFO):
+            return
+        
         self.logger.info(self._colorize(f"ℹ️  {message}", Colors.BRIGHT_BLUE))
 
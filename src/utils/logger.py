@@ -3,15 +3,111 @@ Logging system for the trading bot
 """
 import logging
 import os
+import re
+import threading
 from datetime import datetime
 from logging.handlers import RotatingFileHandler
 import colorlog
 
 
+# Formatters shared by all handlers
+_CONSOLE_FORMATTER = colorlog.ColoredFormatter(
+    '%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S',
+    log_colors={
+        'DEBUG': 'cyan',
+        'INFO': 'green',
+        'WARNING': 'yellow',
+        'ERROR': 'red',
+        'CRITICAL': 'red,bg_white',
+    }
+)
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+
+class _PlainFormatter(logging.Formatter):
+    """File formatter that strips ANSI color codes (e.g. from ConsoleLogger)"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        if '\x1b' in text:
+            text = _ANSI_RE.sub('', text)
+        return text
+
+
+_FILE_FORMATTER = _PlainFormatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+
 class TradingLogger:
     """Centralized logging system"""
     
     _loggers = {}
+    _handlers = None
+    _handlers_lock = threading.Lock()
+    _loggers_lock = threading.Lock()
+    
+    @staticmethod
+    def _get_shared_handlers() -> dict:
+        """
+        Build the console and file handlers on first use
+        
+        Returns:
+            Dict of handler name -> handler, shared by all loggers
+        """
+        with TradingLogger._handlers_lock:
+            if TradingLogger._handlers is not None:
+                return TradingLogger._handlers
+            
+            # Console handler with colors
+            console_handler = colorlog.StreamHandler()
+            console_handler.setLevel(logging.DEBUG)
+            console_handler.setFormatter(_CONSOLE_FORMATTER)
+            
+            # File handler for all logs
+            log_dir = os.path.join(os.path.dirname(__file__), '../../logs')
+            os.makedirs(log_dir, exist_ok=True)
+            
+            # General log file
+            general_log_file = os.path.join(log_dir, 'trading_bot.log')
+            file_handler = RotatingFileHandler(
+                general_log_file,
+                maxBytes=10*1024*1024,  # 10MB
+                backupCount=5
+            )
+            file_handler.setLevel(logging.DEBUG)
+            file_handler.setFormatter(_FILE_FORMATTER)
+            
+            # Trade-specific log file
+            trade_log_file = os.path.join(log_dir, f'trades_{datetime.now().strftime("%Y%m%d")}.log')
+            trade_handler = RotatingFileHandler(
+                trade_log_file,
+                maxBytes=10*1024*1024,
+                backupCount=10,
+                delay=True  # only created once a trade/order logger writes
+            )
+            trade_handler.setLevel(logging.INFO)
+            trade_handler.setFormatter(_FILE_FORMATTER)
+            
+            # Error log file
+            error_log_file = os.path.join(log_dir, 'errors.log')
+            error_handler = RotatingFileHandler(
+                error_log_file,
+                maxBytes=10*1024*1024,
+                backupCount=5
+            )
+            error_handler.setLevel(logging.ERROR)
+            error_handler.setFormatter(_FILE_FORMATTER)
+            
+            TradingLogger._handlers = {
+                'console': console_handler,
+                'general': file_handler,
+                'trade': trade_handler,
+                'error': error_handler,
+            }
+            return TradingLogger._handlers
     
     @staticmethod
     def get_logger(name: str, log_level: str = "INFO") -> logging.Logger:
@@ -25,77 +121,41 @@ class TradingLogger:
         Returns:
             Configured logger instance
         """
-        if name in TradingLogger._loggers:
-            return TradingLogger._loggers[name]
-        
-        logger = logging.getLogger(name)
-        logger.setLevel(getattr(logging, log_level.upper()))
+        # Fast path: a single dict lookup once the logger exists
+        cached = TradingLogger._loggers.get(name)
+        if cached is not None:
+            return cached
         
-        # Prevent duplicate handlers
-        if logger.handlers:
+        with TradingLogger._loggers_lock:
+            # Another thread may have built it while we waited
+            cached = TradingLogger._loggers.get(name)
+            if cached is not None:
+                return cached
+            
+            logger = logging.getLogger(name)
+            logger.setLevel(getattr(logging, log_level.upper()))
+            
+            # Prevent duplicate handlers
+            if logger.handlers:
+                TradingLogger._loggers[name] = logger
+                return logger
+            
+            # Handlers are built once and shared by every logger
+            handlers = TradingLogger._get_shared_handlers()
+            logger.addHandler(handlers['console'])
+            logger.addHandler(handlers['general'])
+            
+            # Trade-specific log file
+            if 'trade' in name.lower() or 'order' in name.lower():
+                logger.addHandler(handlers['trade'])
+            
+            logger.addHandler(handlers['error'])
+            
+            # Our handlers already cover everything; don't repeat via the root logger
+            logger.propagate = False
+            
+            TradingLogger._loggers[name] = logger
             return logger
-        
-        # Console handler with colors
-        console_handler = colorlog.StreamHandler()
-        console_handler.setLevel(logging.DEBUG)
-        console_format = colorlog.ColoredFormatter(
-            '%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S',
-            log_colors={
-                'DEBUG': 'cyan',
-                'INFO': 'green',
-                'WARNING': 'yellow',
-                'ERROR': 'red',
-                'CRITICAL': 'red,bg_white',
-            }
-        )
-        console_handler.setFormatter(console_format)
-        logger.addHandler(console_handler)
-        
-        # File handler for all logs
-        log_dir = os.path.join(os.path.dirname(__file__), '../../logs')
-        os.makedirs(log_dir, exist_ok=True)
-        
-        # General log file
-        general_log_file = os.path.join(log_dir, 'trading_bot.log')
-        file_handler = RotatingFileHandler(
-            general_log_file,
-            maxBytes=10*1024*1024,  # 10MB
-            backupCount=5
-        )
-        file_handler.setLevel(logging.DEBUG)
-        file_format = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        file_handler.setFormatter(file_format)
-        logger.addHandler(file_handler)
-        
-        # Trade-specific log file
-        if 'trade' in name.lower() or 'order' in name.lower():
-            trade_log_file = os.path.join(log_dir, f'trades_{datetime.now().strftime("%Y%m%d")}.log')
-            trade_handler = RotatingFileHandler(
-                trade_log_file,
-                maxBytes=10*1024*1024,
-                backupCount=10
-            )
-            trade_handler.setLevel(logging.INFO)
-            trade_handler.setFormatter(file_format)
-            logger.addHandler(trade_handler)
-        
-        # Error log file
-        error_log_file = os.path.join(log_dir, 'errors.log')
-        error_handler = RotatingFileHandler(
-            error_log_file,
-            maxBytes=10*1024*1024,
-            backupCount=5
-        )
-        error_handler.setLevel(logging.ERROR)
-        error_handler.setFormatter(file_format)
-        logger.addHandler(error_handler)
-        
-        TradingLogger._loggers[name] = logger
-        return logger
 
 
 def log_trade(logger: logging.Logger, action: str, symbol: str, quantity: float, 
@@ -112,17 +172,17 @@ def log_trade(logger: logging.Logger, action: str, symbol: str, quantity: float,
         strategy: Strategy name
         **kwargs: Additional information
     """
-    log_msg = (
-        f"TRADE | {action} | {symbol} | "
-        f"Qty: {quantity} | Price: {price} | "
-        f"Strategy: {strategy}"
-    )
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
+    fmt = "TRADE | %s | %s | Qty: %s | Price: %s | Strategy: %s"
+    args = [action, symbol, quantity, price, strategy]
     if kwargs:
-        extra_info = " | ".join([f"{k}: {v}" for k, v in kwargs.items()])
-        log_msg += f" | {extra_info}"
+        fmt += " | %s: %s" * len(kwargs)
+        for item in kwargs.items():
+            args.extend(item)
     
-    logger.info(log_msg)
+    logger.info(fmt, *args)
 
 
 def log_order(logger: logging.Logger, order_type: str, symbol: str, side: str,
@@ -140,21 +200,24 @@ def log_order(logger: logging.Logger, order_type: str, symbol: str, side: str,
         status: Order status
         **kwargs: Additional information
     """
-    log_msg = (
-        f"ORDER | {order_type} | {side} | {symbol} | "
-        f"Qty: {quantity}"
-    )
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
-    if price:
-        log_msg += f" | Price: {price}"
+    fmt = "ORDER | %s | %s | %s | Qty: %s"
+    args = [order_type, side, symbol, quantity]
     
-    log_msg += f" | Status: {status}"
+    if price:
+        fmt += " | Price: %s"
+        args.append(price)
     
+    fmt += " | Status: %s"
+    args.append(status)
     if kwargs:
-        extra_info = " | ".join([f"{k}: {v}" for k, v in kwargs.items()])
-        log_msg += f" | {extra_info}"
+        fmt += " | %s: %s" * len(kwargs)
+        for item in kwargs.items():
+            args.extend(item)
     
-    logger.info(log_msg)
+    logger.info(fmt, *args)
 
 
 def log_pnl(logger: logging.Logger, symbol: str, pnl: float, pnl_pct: float,
@@ -170,18 +233,16 @@ def log_pnl(logger: logging.Logger, symbol: str, pnl: float, pnl_pct: float,
         strategy: Strategy name
         **kwargs: Additional information
     """
-    log_msg = (
-        f"PNL | {symbol} | "
-        f"Amount: {pnl:.4f} | Pct: {pnl_pct:.2f}% | "
-        f"Strategy: {strategy}"
-    )
+    level = logging.INFO if pnl >= 0 else logging.WARNING
+    if not logger.isEnabledFor(level):
+        return
     
+    fmt = "PNL | %s | Amount: %.4f | Pct: %.2f%% | Strategy: %s"
+    args = [symbol, pnl, pnl_pct, strategy]
     if kwargs:
-        extra_info = " | ".join([f"{k}: {v}" for k, v in kwargs.items()])
-        log_msg += f" | {extra_info}"
+        fmt += " | %s: %s" * len(kwargs)
+        for item in kwargs.items():
+            args.extend(item)
     
-    if pnl >= 0:
-        logger.info(log_msg)
-    else:
-        logger.warning(log_msg)
+    logger.log(level, fmt, *args)
 
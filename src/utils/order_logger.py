@@ -3,26 +3,94 @@ Order logging and tracking system
 """
 import os
 import csv
+import atexit
+import logging
+import queue
+import threading
+import time
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional, Set
 import pandas as pd
 
 
+logger = logging.getLogger(__name__)
+
+ORDER_HEADERS = (
+    'timestamp',
+    'session_id',
+    'symbol',
+    'order_id',
+    'client_order_id',
+    'type',  # BUY or SELL
+    'side',  # LONG or SHORT
+    'action',  # OPEN or CLOSE
+    'price',
+    'quantity',
+    'value',
+    'status',  # NEW, FILLED, PARTIALLY_FILLED, CANCELLED, REJECTED
+    'strategy',
+    'tag',
+    'reason',
+    'mode'  # backtest, paper, testnet, mainnet
+)
+
+FILL_HEADERS = (
+    'timestamp',
+    'session_id',
+    'symbol',
+    'order_id',
+    'fill_id',
+    'type',  # BUY or SELL
+    'side',  # LONG or SHORT
+    'action',  # OPEN or CLOSE
+    'price',
+    'quantity',
+    'value',
+    'fee',
+    'fee_asset',
+    'pnl',
+    'pnl_pct',
+    'strategy',
+    'tag'
+)
+
+# Per-column CSV number formats (None = written as is); applied on the writer thread
+_ROW_FORMATS = {
+    'orders': tuple({'price': '.8f', 'quantity': '.8f', 'value': '.2f'}.get(h)
+                    for h in ORDER_HEADERS),
+    'fills': tuple({'price': '.8f', 'quantity': '.8f', 'value': '.2f', 'fee': '.8f',
+                    'pnl': '.2f', 'pnl_pct': '.2f'}.get(h)
+                   for h in FILL_HEADERS),
+    'events': (None, None, None),
+}
+
+
 class OrderLogger:
     """
     Enhanced order logger that tracks all order activities
     and saves detailed logs to CSV files
     """
     
-    def __init__(self, output_dir: str = "./data/outputs"):
+    # (epoch second, formatted timestamp) of the last _now_str call
+    _ts_cache = (0, '')
+    
+    # Output directories already created by this process
+    _dirs_created: Set[str] = set()
+    
+    def __init__(self, output_dir: str = "./data/outputs", flush_interval: int = 50,
+                 flush_seconds: float = 1.0):
         """
         Initialize OrderLogger
         
         Args:
             output_dir: Directory to save output files
+            flush_interval: Rows written between flushes of the CSV buffers
+            flush_seconds: Max age of unflushed rows before they are flushed
         """
         self.output_dir = output_dir
-        os.makedirs(output_dir, exist_ok=True)
+        if output_dir not in OrderLogger._dirs_created:
+            os.makedirs(output_dir, exist_ok=True)
+            OrderLogger._dirs_created.add(output_dir)
         
         # Generate session ID
         self.session_id = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -31,65 +99,80 @@ class OrderLogger:
         self.orders_file = os.path.join(output_dir, f'orders_{self.session_id}.csv')
         self.fills_file = os.path.join(output_dir, f'fills_{self.session_id}.csv')
         self.summary_file = os.path.join(output_dir, f'summary_{self.session_id}.csv')
+        self.order_events_file = os.path.join(output_dir, f'order_events_{self.session_id}.csv')
         
         # Initialize CSV files
         self._init_orders_csv()
         self._init_fills_csv()
+        self._init_order_events_csv()
+        
+        # Persistent buffered append handles, written only by the writer
+        # thread; rows reach disk every flush_interval rows or flush_seconds
+        # (whichever comes first), on flush()/close() and at interpreter exit
+        self.flush_interval = max(1, flush_interval)
+        self.flush_seconds = flush_seconds
+        self._pending_rows = 0
+        self._last_flush = time.monotonic()
+        self._orders_fh = open(self.orders_file, 'a', newline='', buffering=1 << 16)
+        self._fills_fh = open(self.fills_file, 'a', newline='', buffering=1 << 16)
+        self._events_fh = open(self.order_events_file, 'a', newline='', buffering=1 << 16)
+        self._writers = {
+            'orders': csv.writer(self._orders_fh),
+            'fills': csv.writer(self._fills_fh),
+            'events': csv.writer(self._events_fh),
+        }
+        
+        # log_* calls only enqueue (target, row); the writer thread blocks on
+        # the queue and writes whatever has accumulated as one batch
+        self._queue: queue.Queue = queue.Queue(maxsize=10000)
+        self._writer_thread = threading.Thread(
+            target=self._drain, name=f'OrderLogger-{self.session_id}', daemon=True
+        )
+        self._writer_thread.start()
+        self._closed = False
+        # Rows dropped because the queue was full or the logger was closed
+        self._dropped_rows = 0
+        atexit.register(self.close)
         
         # In-memory tracking
         self.orders = []
         self.fills = []
+        self._orders_by_id: Dict[str, Dict] = {}
+        
+        # Running fill aggregates so generate_summary is O(1)
+        self._agg = {
+            'volume': 0.0, 'fees': 0.0, 'pnl': 0.0,
+            'buy': 0, 'sell': 0, 'open': 0, 'close': 0,
+            'close_wins': 0, 'close_pnl_sum': 0.0
+        }
         
     def _init_orders_csv(self):
         """Initialize orders CSV file with headers"""
-        headers = [
-            'timestamp',
-            'session_id',
-            'symbol',
-            'order_id',
-            'client_order_id',
-            'type',  # BUY or SELL
-            'side',  # LONG or SHORT
-            'action',  # OPEN or CLOSE
-            'price',
-            'quantity',
-            'value',
-            'status',  # NEW, FILLED, PARTIALLY_FILLED, CANCELLED, REJECTED
-            'strategy',
-            'tag',
-            'reason',
-            'mode'  # backtest, paper, testnet, mainnet
-        ]
-        
         with open(self.orders_file, 'w', newline='') as f:
             writer = csv.writer(f)
-            writer.writerow(headers)
+            writer.writerow(ORDER_HEADERS)
     
     def _init_fills_csv(self):
         """Initialize fills CSV file with headers"""
-        headers = [
-            'timestamp',
-            'session_id',
-            'symbol',
-            'order_id',
-            'fill_id',
-            'type',  # BUY or SELL
-            'side',  # LONG or SHORT
-            'action',  # OPEN or CLOSE
-            'price',
-            'quantity',
-            'value',
-            'fee',
-            'fee_asset',
-            'pnl',
-            'pnl_pct',
-            'strategy',
-            'tag'
-        ]
-        
         with open(self.fills_file, 'w', newline='') as f:
             writer = csv.writer(f)
-            writer.writerow(headers)
+            writer.writerow(FILL_HEADERS)
+    
+    def _init_order_events_csv(self):
+        """Initialize order status events CSV file with headers"""
+        with open(self.order_events_file, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['timestamp', 'order_id', 'status'])
+    
+    def _now_str(self) -> str:
+        """Current local time as 'YYYY-mm-dd HH:MM:SS', formatted once per second"""
+        second = int(time.time())
+        cached = OrderLogger._ts_cache
+        if cached[0] == second:
+            return cached[1]
+        text = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+        OrderLogger._ts_cache = (second, text)
+        return text
     
     def log_order(self, 
                   symbol: str,
@@ -126,7 +209,7 @@ class OrderLogger:
         Returns:
             Order record dict
         """
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = self._now_str()
         value = price * quantity
         
         if not order_id:
@@ -135,49 +218,20 @@ class OrderLogger:
         if not client_order_id:
             client_order_id = f"CLI_{self.session_id}_{len(self.orders)}"
         
-        order_record = {
-            'timestamp': timestamp,
-            'session_id': self.session_id,
-            'symbol': symbol,
-            'order_id': order_id,
-            'client_order_id': client_order_id,
-            'type': order_type,
-            'side': side,
-            'action': action,
-            'price': price,
-            'quantity': quantity,
-            'value': value,
-            'status': status,
-            'strategy': strategy,
-            'tag': tag,
-            'reason': reason,
-            'mode': mode
-        }
+        # Row in ORDER_HEADERS order; the record dict is built from it
+        row = (
+            timestamp, self.session_id, symbol, order_id, client_order_id,
+            order_type, side, action, price, quantity, value, status,
+            strategy, tag, reason, mode
+        )
+        order_record = dict(zip(ORDER_HEADERS, row))
         
         # Save to memory
         self.orders.append(order_record)
+        self._orders_by_id.setdefault(order_id, order_record)
         
-        # Append to CSV
-        with open(self.orders_file, 'a', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                order_record['timestamp'],
-                order_record['session_id'],
-                order_record['symbol'],
-                order_record['order_id'],
-                order_record['client_order_id'],
-                order_record['type'],
-                order_record['side'],
-                order_record['action'],
-                f"{order_record['price']:.8f}",
-                f"{order_record['quantity']:.8f}",
-                f"{order_record['value']:.2f}",
-                order_record['status'],
-                order_record['strategy'],
-                order_record['tag'],
-                order_record['reason'],
-                order_record['mode']
-            ])
+        # Append to CSV (on the writer thread)
+        self._enqueue('orders', row)
         
         return order_record
     
@@ -218,73 +272,170 @@ class OrderLogger:
         Returns:
             Fill record dict
         """
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = self._now_str()
         value = price * quantity
         
         if not fill_id:
             fill_id = f"FILL_{self.session_id}_{len(self.fills)}"
         
-        fill_record = {
-            'timestamp': timestamp,
-            'session_id': self.session_id,
-            'symbol': symbol,
-            'order_id': order_id,
-            'fill_id': fill_id,
-            'type': fill_type,
-            'side': side,
-            'action': action,
-            'price': price,
-            'quantity': quantity,
-            'value': value,
-            'fee': fee,
-            'fee_asset': fee_asset,
-            'pnl': pnl,
-            'pnl_pct': pnl_pct,
-            'strategy': strategy,
-            'tag': tag
-        }
+        # Row in FILL_HEADERS order; the record dict is built from it
+        row = (
+            timestamp, self.session_id, symbol, order_id, fill_id,
+            fill_type, side, action, price, quantity, value, fee,
+            fee_asset, pnl, pnl_pct, strategy, tag
+        )
+        fill_record = dict(zip(FILL_HEADERS, row))
         
         # Save to memory
         self.fills.append(fill_record)
         
-        # Append to CSV
-        with open(self.fills_file, 'a', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                fill_record['timestamp'],
-                fill_record['session_id'],
-                fill_record['symbol'],
-                fill_record['order_id'],
-                fill_record['fill_id'],
-                fill_record['type'],
-                fill_record['side'],
-                fill_record['action'],
-                f"{fill_record['price']:.8f}",
-                f"{fill_record['quantity']:.8f}",
-                f"{fill_record['value']:.2f}",
-                f"{fill_record['fee']:.8f}",
-                fill_record['fee_asset'],
-                f"{fill_record['pnl']:.2f}",
-                f"{fill_record['pnl_pct']:.2f}",
-                fill_record['strategy'],
-                fill_record['tag']
-            ])
+        agg = self._agg
+        agg['volume'] += value
+        agg['fees'] += fee
+        agg['pnl'] += pnl
+        if fill_type == 'BUY':
+            agg['buy'] += 1
+        elif fill_type == 'SELL':
+            agg['sell'] += 1
+        if action == 'OPEN':
+            agg['open'] += 1
+        elif action == 'CLOSE':
+            agg['close'] += 1
+            agg['close_pnl_sum'] += pnl
+            if pnl > 0:
+                agg['close_wins'] += 1
+        
+        # Append to CSV (on the writer thread)
+        self._enqueue('fills', row)
         
         return fill_record
     
+    def _enqueue(self, target: str, row: tuple):
+        """
+        Hand a row to the writer thread without ever blocking the caller
+        
+        Args:
+            target: 'orders', 'fills' or 'events'
+            row: Row values in header order
+        """
+        if self._closed:
+            self._drop(target, 'logger is closed')
+        elif not self._writer_thread.is_alive():
+            # No writer thread left to race with: write in the caller
+            self._write_row(target, row)
+            self._flush_files()
+        else:
+            try:
+                self._queue.put_nowait((target, row))
+            except queue.Full:
+                self._drop(target, 'write queue is full')
+    
+    def _drop(self, target: str, reason: str):
+        """Count a row that could not be written (warns on the first one)"""
+        self._dropped_rows += 1
+        if self._dropped_rows == 1:
+            logger.warning("OrderLogger: dropping %s rows, %s", target, reason)
+    
+    def _write_row(self, target: str, row: tuple):
+        """Format and write one row to its CSV buffer, logging any error"""
+        try:
+            self._writers[target].writerow([
+                value if fmt is None else format(value, fmt)
+                for value, fmt in zip(row, _ROW_FORMATS[target])
+            ])
+        except Exception as e:
+            logger.error("OrderLogger: error writing %s row: %s", target, e)
+        self._pending_rows += 1
+    
+    def _drain(self):
+        """Writer thread: block for queued rows and write them in batches"""
+        while True:
+            # Only wait with a timeout while rows are sitting in the buffers
+            try:
+                first = self._queue.get(
+                    timeout=self.flush_seconds if self._pending_rows else None
+                )
+            except queue.Empty:
+                self._flush_files()
+                continue
+            
+            batch = [first]
+            try:
+                while len(batch) < 512:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            
+            stop = False
+            try:
+                for item in batch:
+                    if item is None:
+                        stop = True
+                        continue
+                    self._write_row(*item)
+                
+                if (stop or self._pending_rows >= self.flush_interval
+                        or time.monotonic() - self._last_flush >= self.flush_seconds):
+                    self._flush_files()
+            except Exception:
+                # Keep the thread alive; a dead writer would strand queued rows
+                logger.exception("OrderLogger: writer thread error")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                return
+    
+    def _flush_files(self):
+        """Flush the CSV file buffers, logging (not raising) I/O errors"""
+        self._pending_rows = 0
+        self._last_flush = time.monotonic()
+        for fh in (self._orders_fh, self._fills_fh, self._events_fh):
+            if fh.closed:
+                continue
+            try:
+                fh.flush()
+            except (OSError, ValueError) as e:
+                logger.error("OrderLogger: error flushing %s: %s", fh.name, e)
+    
+    def flush(self):
+        """Wait for queued rows to be written, then flush them to disk"""
+        if self._writer_thread.is_alive():
+            self._queue.join()
+        self._flush_files()
+    
+    def close(self):
+        """Write queued rows, stop the writer thread and close the CSV handles"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer_thread.is_alive():
+            self._queue.put(None)
+            self._writer_thread.join()
+        self._flush_files()
+        for fh in (self._orders_fh, self._fills_fh, self._events_fh):
+            try:
+                fh.close()
+            except OSError as e:
+                logger.error("OrderLogger: error closing %s: %s", fh.name, e)
+        if self._dropped_rows:
+            logger.warning("OrderLogger: %d rows were dropped", self._dropped_rows)
+        # Let the logger, its files and thread be collected
+        atexit.unregister(self.close)
+    
     def update_order_status(self, order_id: str, status: str):
-        """Update order status in CSV"""
+        """
+        Update order status
+        
+        The orders CSV is append-only; the change is recorded as a row in the
+        order events CSV and folded back in by get_orders_df.
+        """
         # Update in memory
-        for order in self.orders:
-            if order['order_id'] == order_id:
-                order['status'] = status
-                break
-        
-        # Rewrite CSV with updated status
-        if os.path.exists(self.orders_file):
-            df = pd.read_csv(self.orders_file)
-            df.loc[df['order_id'] == order_id, 'status'] = status
-            df.to_csv(self.orders_file, index=False)
+        order = self._orders_by_id.get(order_id)
+        if order is not None:
+            order['status'] = status
+        
+        self._enqueue('events', (self._now_str(), order_id, status))
     
     def generate_summary(self) -> Dict:
         """
@@ -304,42 +455,28 @@ class OrderLogger:
                 'avg_pnl': 0.0
             }
         
-        fills_df = pd.DataFrame(self.fills)
-        
-        # Calculate metrics
-        total_volume = fills_df['value'].sum()
-        total_fees = fills_df['fee'].sum()
-        total_pnl = fills_df['pnl'].sum()
+        agg = self._agg
         
         # Win rate (only for CLOSE actions)
-        close_fills = fills_df[fills_df['action'] == 'CLOSE']
-        if len(close_fills) > 0:
-            winning_fills = close_fills[close_fills['pnl'] > 0]
-            win_rate = (len(winning_fills) / len(close_fills)) * 100
-            avg_pnl = close_fills['pnl'].mean()
+        close_count = agg['close']
+        if close_count > 0:
+            win_rate = (agg['close_wins'] / close_count) * 100
+            avg_pnl = agg['close_pnl_sum'] / close_count
         else:
             win_rate = 0.0
             avg_pnl = 0.0
         
-        # Count by type
-        buy_count = len(fills_df[fills_df['type'] == 'BUY'])
-        sell_count = len(fills_df[fills_df['type'] == 'SELL'])
-        
-        # Count by action
-        open_count = len(fills_df[fills_df['action'] == 'OPEN'])
-        close_count = len(fills_df[fills_df['action'] == 'CLOSE'])
-        
         summary = {
             'session_id': self.session_id,
             'total_orders': len(self.orders),
             'total_fills': len(self.fills),
-            'buy_fills': buy_count,
-            'sell_fills': sell_count,
-            'open_fills': open_count,
+            'buy_fills': agg['buy'],
+            'sell_fills': agg['sell'],
+            'open_fills': agg['open'],
             'close_fills': close_count,
-            'total_volume': total_volume,
-            'total_fees': total_fees,
-            'total_pnl': total_pnl,
+            'total_volume': agg['volume'],
+            'total_fees': agg['fees'],
+            'total_pnl': agg['pnl'],
             'win_rate': win_rate,
             'avg_pnl': avg_pnl
         }
@@ -350,20 +487,62 @@ class OrderLogger:
         
         return summary
     
+    def iter_orders(self) -> Iterator[Dict[str, str]]:
+        """
+        Stream orders from the CSV as dicts of strings (no pandas)
+        
+        Status reflects the latest order event, as in get_orders_df.
+        """
+        self.flush()
+        if not os.path.exists(self.orders_file):
+            return
+        
+        latest = {}
+        if os.path.exists(self.order_events_file):
+            with open(self.order_events_file, newline='') as f:
+                for event in csv.DictReader(f):
+                    latest[event['order_id']] = event['status']
+        
+        with open(self.orders_file, newline='') as f:
+            for row in csv.DictReader(f):
+                status = latest.get(row['order_id'])
+                if status is not None:
+                    row['status'] = status
+                yield row
+    
+    def iter_fills(self) -> Iterator[Dict[str, str]]:
+        """Stream fills from the CSV as dicts of strings (no pandas)"""
+        self.flush()
+        if not os.path.exists(self.fills_file):
+            return
+        
+        with open(self.fills_file, newline='') as f:
+            yield from csv.DictReader(f)
+    
     def get_orders_df(self) -> pd.DataFrame:
-        """Get orders as DataFrame"""
-        if os.path.exists(self.orders_file):
-            return pd.read_csv(self.orders_file)
-        return pd.DataFrame()
+        """Get orders as DataFrame, with the latest status from order events"""
+        self.flush()
+        if not os.path.exists(self.orders_file):
+            return pd.DataFrame()
+        
+        df = pd.read_csv(self.orders_file)
+        if os.path.exists(self.order_events_file):
+            events = pd.read_csv(self.order_events_file)
+            if not events.empty:
+                latest = events.groupby('order_id')['status'].last()
+                df['status'] = df['order_id'].map(latest).fillna(df['status'])
+        return df
     
     def get_fills_df(self) -> pd.DataFrame:
         """Get fills as DataFrame"""
+        self.flush()
         if os.path.exists(self.fills_file):
             return pd.read_csv(self.fills_file)
         return pd.DataFrame()
     
     def print_summary(self):
         """Print summary to console"""
+        self.flush()
         summary = self.generate_summary()
         
         print("\n" + "="*70)
@@ -386,6 +565,7 @@ class OrderLogger:
         print(f"\nFiles:")
         print(f"  Orders: {self.orders_file}")
         print(f"  Fills: {self.fills_file}")
+        print(f"  Order events: {self.order_events_file}")
         print(f"  Summary: {self.summary_file}")
         print("="*70 + "\n")
 
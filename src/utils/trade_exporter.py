@@ -1,11 +1,85 @@
 """
 Trade exporter with improved formatting and analysis
 """
+import numpy as np
 import pandas as pd
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Tuple
 from datetime import datetime
 
 
+# Output column order for format_trades_df (optional columns go last)
+_COLUMN_ORDER = [
+    'timestamp',
+    'symbol',
+    'strategy',
+    'action',
+    'order_type',
+    'side',
+    'price',
+    'quantity',
+    'value',
+    'pnl',
+    'pnl_pct',
+    'cumulative_pnl',
+    'cash_after',
+    'entry_price',
+    'entry_value',
+    'win'
+]
+_CATEGORY_COLS = ('symbol', 'strategy', 'action', 'side', 'order_type')
+_NUMERIC_COLS = ('price', 'quantity', 'value', 'pnl', 'pnl_pct',
+                 'cumulative_pnl', 'cash_after')
+
+# Columns get_trade_summary needs from the raw trade records
+_SUMMARY_COLS = ['symbol', 'strategy', 'action', 'value', 'pnl']
+
+# Summary text shared by print_trade_summary and export_detailed_report
+_RULE = "=" * 60
+_SUMMARY_BODY = (
+    "Orders:\n"
+    "  Total Orders:  {total_orders}\n"
+    "  Open Orders:   {open_orders}\n"
+    "  Close Orders:  {close_orders}\n"
+    "\n"
+    "Performance:\n"
+    "  Total PnL:     ${total_pnl:,.4f}\n"
+    "  Total Volume:  ${total_volume:,.4f}\n"
+    "\n"
+    "Trades:\n"
+    "  Winning:       {winning_trades}\n"
+    "  Losing:        {losing_trades}\n"
+    "  Win Rate:      {win_rate:.2f}%\n"
+    "\n"
+    "PnL Stats:\n"
+    "  Avg Win:       ${avg_win:,.4f}\n"
+    "  Avg Loss:      ${avg_loss:,.4f}\n"
+    "  Best Trade:    ${best_trade:,.4f}\n"
+    "  Worst Trade:   ${worst_trade:,.4f}\n"
+    "  Profit Factor: {profit_factor:.2f}\n"
+)
+
+
+@lru_cache(maxsize=8)
+def _column_plan(columns: frozenset) -> Tuple[List[str], Dict[str, str], Dict[str, int]]:
+    """
+    Projection, categorical casts and rounding for a trade-record schema
+    
+    Trade histories only ever have a couple of schemas (with or without the
+    CLOSE-only columns), so the plan is worked out once per key set.
+    
+    Args:
+        columns: Column names present in the raw trade DataFrame
+        
+    Returns:
+        (ordered output columns, astype mapping, round mapping)
+    """
+    existing_cols = [col for col in _COLUMN_ORDER if col in columns]
+    category_dtypes = {col: 'category' for col in _CATEGORY_COLS if col in columns}
+    round_digits = {col: 8 for col in _NUMERIC_COLS if col in columns}
+    return existing_cols, category_dtypes, round_digits
+
+
 class TradeExporter:
     """Export and format trade history"""
     
@@ -28,39 +102,16 @@ class TradeExporter:
         # Convert timestamp to datetime
         df['timestamp'] = pd.to_datetime(df['timestamp'])
         
-        # Reorder columns for better readability
-        column_order = [
-            'timestamp',
-            'symbol',
-            'strategy',
-            'action',
-            'order_type',
-            'side',
-            'price',
-            'quantity',
-            'value',
-            'pnl',
-            'pnl_pct',
-            'cumulative_pnl',
-            'cash_after'
-        ]
-        
-        # Add optional columns if they exist
-        optional_cols = ['entry_price', 'entry_value', 'win']
-        for col in optional_cols:
-            if col in df.columns:
-                column_order.append(col)
-        
-        # Select only existing columns
-        existing_cols = [col for col in column_order if col in df.columns]
+        # Project, categorize and round per the (cached) plan for this schema
+        existing_cols, category_dtypes, round_digits = _column_plan(frozenset(df.columns))
         df = df[existing_cols]
         
-        # Round numeric columns
-        numeric_cols = ['price', 'quantity', 'value', 'pnl', 'pnl_pct', 
-                       'cumulative_pnl', 'cash_after']
-        for col in numeric_cols:
-            if col in df.columns:
-                df[col] = df[col].round(8)
+        # Low-cardinality labels as categoricals: comparisons and grouping
+        # work on small integer codes instead of hashing strings
+        df = df.astype(category_dtypes)
+        
+        # Round numeric columns (one DataFrame.round call for all of them)
+        df = df.round(round_digits)
         
         return df
     
@@ -73,8 +124,11 @@ class TradeExporter:
             trade_history: List of trade records
             filepath: Output file path
         """
-        df = TradeExporter.format_trades_df(trade_history)
-        
+        TradeExporter._write_csv(TradeExporter.format_trades_df(trade_history), filepath)
+    
+    @staticmethod
+    def _write_csv(df: pd.DataFrame, filepath: str):
+        """Write an already formatted trades DataFrame to CSV"""
         if df.empty:
             print(f"No trades to export")
             return
@@ -82,6 +136,31 @@ class TradeExporter:
         df.to_csv(filepath, index=False)
         print(f"Exported {len(df)} trade records to {filepath}")
     
+    @staticmethod
+    def export_to_parquet(trade_history: List[Dict], filepath: str):
+        """
+        Export trades to a zstd-compressed Parquet file
+        
+        Much smaller than the CSV and reloads with typed columns, so repeated
+        analysis doesn't re-parse text. Requires pyarrow (not installed by
+        default).
+        
+        Args:
+            trade_history: List of trade records
+            filepath: Output file path
+        """
+        TradeExporter._write_parquet(TradeExporter.format_trades_df(trade_history), filepath)
+    
+    @staticmethod
+    def _write_parquet(df: pd.DataFrame, filepath: str):
+        """Write an already formatted trades DataFrame to Parquet"""
+        if df.empty:
+            print(f"No trades to export")
+            return
+        
+        df.to_parquet(filepath, index=False, compression='zstd')
+        print(f"Exported {len(df)} trade records to {filepath}")
+    
     @staticmethod
     def get_trade_summary(trade_history: List[Dict]) -> Dict:
         """
@@ -93,18 +172,40 @@ class TradeExporter:
         Returns:
             Dictionary with summary statistics
         """
-        df = TradeExporter.format_trades_df(trade_history)
+        if not trade_history:
+            return {}
+        
+        # Only the columns the stats read; the timestamp parsing, column
+        # reordering and rounding in format_trades_df are presentation only
+        df = pd.DataFrame(trade_history, columns=_SUMMARY_COLS)
+        return TradeExporter._summarize(df)
+    
+    @staticmethod
+    def _summarize(df: pd.DataFrame) -> Dict:
+        """
+        Summary statistics for a trades DataFrame
         
+        Args:
+            df: Trades with at least the _SUMMARY_COLS columns; either the raw
+                trade history (get_trade_summary) or the format_trades_df
+                output (export_detailed_report)
+            
+        Returns:
+            Dictionary with summary statistics
+        """
         if df.empty:
             return {}
         
-        # Filter only CLOSE actions for PnL analysis
-        closed_trades = df[df['action'] == 'CLOSE'].copy()
+        # Compute the action/pnl masks once and share them across all metrics
+        action = df['action']
+        is_close = (action == 'CLOSE').to_numpy()
+        open_orders = int((action == 'OPEN').sum())
+        total_closed = int(np.count_nonzero(is_close))
         
-        if closed_trades.empty:
+        if total_closed == 0:
             return {
                 'total_orders': len(df),
-                'open_orders': len(df[df['action'] == 'OPEN']),
+                'open_orders': open_orders,
                 'close_orders': 0,
                 'total_pnl': 0.0,
                 'winning_trades': 0,
@@ -112,37 +213,37 @@ class TradeExporter:
                 'win_rate': 0.0
             }
         
+        # Slice only the columns the stats need instead of filtering the whole frame
+        closed_pnl = df['pnl'].to_numpy(dtype=float)[is_close]
+        wins = closed_pnl[closed_pnl > 0]
+        losses = closed_pnl[closed_pnl < 0]
+        
         # Calculate statistics
-        total_pnl = closed_trades['pnl'].sum()
-        winning_trades = len(closed_trades[closed_trades['pnl'] > 0])
-        losing_trades = len(closed_trades[closed_trades['pnl'] < 0])
-        total_closed = len(closed_trades)
+        total_pnl = closed_pnl.sum()
+        winning_trades = len(wins)
+        losing_trades = len(losses)
         
-        win_rate = (winning_trades / total_closed * 100) if total_closed > 0 else 0.0
+        win_rate = winning_trades / total_closed * 100
         
-        avg_win = closed_trades[closed_trades['pnl'] > 0]['pnl'].mean() if winning_trades > 0 else 0.0
-        avg_loss = closed_trades[closed_trades['pnl'] < 0]['pnl'].mean() if losing_trades > 0 else 0.0
+        avg_win = wins.mean() if winning_trades > 0 else 0.0
+        avg_loss = losses.mean() if losing_trades > 0 else 0.0
         
         # Best and worst trades
-        best_trade = closed_trades['pnl'].max() if total_closed > 0 else 0.0
-        worst_trade = closed_trades['pnl'].min() if total_closed > 0 else 0.0
+        best_trade = closed_pnl.max()
+        worst_trade = closed_pnl.min()
         
         # Trading volume
         total_volume = df['value'].sum()
         
-        # By strategy
-        strategy_stats = closed_trades.groupby('strategy').agg({
-            'pnl': ['sum', 'count', 'mean']
-        }).round(4)
-        
-        # By symbol
-        symbol_stats = closed_trades.groupby('symbol').agg({
-            'pnl': ['sum', 'count', 'mean']
-        }).round(4)
+        # By strategy / by symbol
+        strategy_stats = TradeExporter._group_pnl_stats(
+            df['strategy'][is_close], closed_pnl)
+        symbol_stats = TradeExporter._group_pnl_stats(
+            df['symbol'][is_close], closed_pnl)
         
         return {
             'total_orders': len(df),
-            'open_orders': len(df[df['action'] == 'OPEN']),
+            'open_orders': open_orders,
             'close_orders': total_closed,
             'total_pnl': round(total_pnl, 4),
             'winning_trades': winning_trades,
@@ -154,8 +255,42 @@ class TradeExporter:
             'worst_trade': round(worst_trade, 4),
             'total_volume': round(total_volume, 4),
             'profit_factor': round(abs(avg_win / avg_loss), 2) if avg_loss != 0 else 0.0,
-            'strategy_stats': strategy_stats.to_dict() if not strategy_stats.empty else {},
-            'symbol_stats': symbol_stats.to_dict() if not symbol_stats.empty else {}
+            'strategy_stats': strategy_stats,
+            'symbol_stats': symbol_stats
+        }
+    
+    @staticmethod
+    def _group_pnl_stats(keys: pd.Series, pnl: np.ndarray) -> Dict:
+        """
+        Per-key pnl sum/count/mean in one bincount pass
+        
+        Same shape as groupby(key).agg({'pnl': ['sum', 'count', 'mean']})
+        .round(4).to_dict(): sorted keys, missing keys dropped.
+        
+        Args:
+            keys: Group key per closed trade
+            pnl: PnL per closed trade
+            
+        Returns:
+            {('pnl', 'sum'|'count'|'mean'): {key: value}}, or {} if no groups
+        """
+        codes, uniques = pd.factorize(keys, sort=True)
+        valid = codes >= 0
+        if not valid.all():
+            codes, pnl = codes[valid], pnl[valid]
+        if len(uniques) == 0:
+            return {}
+        
+        n = len(uniques)
+        sums = np.bincount(codes, weights=pnl, minlength=n)
+        counts = np.bincount(codes, minlength=n)
+        means = sums / counts
+        
+        labels = uniques.tolist()
+        return {
+            ('pnl', 'sum'): dict(zip(labels, np.round(sums, 4).tolist())),
+            ('pnl', 'count'): dict(zip(labels, counts.tolist())),
+            ('pnl', 'mean'): dict(zip(labels, np.round(means, 4).tolist()))
         }
     
     @staticmethod
@@ -172,82 +307,49 @@ class TradeExporter:
             print("No trades to summarize")
             return
         
-        print("\n" + "="*60)
-        print("TRADE SUMMARY")
-        print("="*60)
-        
-        print(f"\nOrders:")
-        print(f"  Total Orders:  {summary['total_orders']}")
-        print(f"  Open Orders:   {summary['open_orders']}")
-        print(f"  Close Orders:  {summary['close_orders']}")
-        
-        print(f"\nPerformance:")
-        print(f"  Total PnL:     ${summary['total_pnl']:,.4f}")
-        print(f"  Total Volume:  ${summary['total_volume']:,.4f}")
-        
-        print(f"\nTrades:")
-        print(f"  Winning:       {summary['winning_trades']}")
-        print(f"  Losing:        {summary['losing_trades']}")
-        print(f"  Win Rate:      {summary['win_rate']:.2f}%")
-        
-        print(f"\nPnL Stats:")
-        print(f"  Avg Win:       ${summary['avg_win']:,.4f}")
-        print(f"  Avg Loss:      ${summary['avg_loss']:,.4f}")
-        print(f"  Best Trade:    ${summary['best_trade']:,.4f}")
-        print(f"  Worst Trade:   ${summary['worst_trade']:,.4f}")
-        print(f"  Profit Factor: {summary['profit_factor']:.2f}")
-        
-        print("="*60 + "\n")
+        print(f"\n{_RULE}\nTRADE SUMMARY\n{_RULE}\n\n"
+              f"{_SUMMARY_BODY.format_map(summary)}"
+              f"{_RULE}\n")
     
     @staticmethod
-    def export_detailed_report(trade_history: List[Dict], filepath: str):
+    def export_detailed_report(trade_history: List[Dict], filepath: str,
+                               parquet: bool = False):
         """
         Export detailed trade report with analysis
         
         Args:
             trade_history: List of trade records
             filepath: Output file path (without extension)
+            parquet: Also write the trades as Parquet (requires pyarrow)
         """
+        # Format once; the CSV, Parquet and summary all reuse the same frame
+        df = TradeExporter.format_trades_df(trade_history)
+        
         # Export trades CSV
         csv_path = f"{filepath}_trades.csv"
-        TradeExporter.export_to_csv(trade_history, csv_path)
+        TradeExporter._write_csv(df, csv_path)
+        
+        if parquet:
+            parquet_path = f"{filepath}_trades.parquet"
+            TradeExporter._write_parquet(df, parquet_path)
         
         # Get summary
-        summary = TradeExporter.get_trade_summary(trade_history)
+        summary = TradeExporter._summarize(df)
         
         # Export summary as text
         summary_path = f"{filepath}_summary.txt"
+        generated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         with open(summary_path, 'w') as f:
-            f.write("="*60 + "\n")
-            f.write("TRADE SUMMARY REPORT\n")
-            f.write("="*60 + "\n\n")
-            
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            
-            f.write(f"Orders:\n")
-            f.write(f"  Total Orders:  {summary['total_orders']}\n")
-            f.write(f"  Open Orders:   {summary['open_orders']}\n")
-            f.write(f"  Close Orders:  {summary['close_orders']}\n\n")
-            
-            f.write(f"Performance:\n")
-            f.write(f"  Total PnL:     ${summary['total_pnl']:,.4f}\n")
-            f.write(f"  Total Volume:  ${summary['total_volume']:,.4f}\n\n")
-            
-            f.write(f"Trades:\n")
-            f.write(f"  Winning:       {summary['winning_trades']}\n")
-            f.write(f"  Losing:        {summary['losing_trades']}\n")
-            f.write(f"  Win Rate:      {summary['win_rate']:.2f}%\n\n")
-            
-            f.write(f"PnL Stats:\n")
-            f.write(f"  Avg Win:       ${summary['avg_win']:,.4f}\n")
-            f.write(f"  Avg Loss:      ${summary['avg_loss']:,.4f}\n")
-            f.write(f"  Best Trade:    ${summary['best_trade']:,.4f}\n")
-            f.write(f"  Worst Trade:   ${summary['worst_trade']:,.4f}\n")
-            f.write(f"  Profit Factor: {summary['profit_factor']:.2f}\n\n")
-            
-            f.write("="*60 + "\n")
+            f.write(
+                f"{_RULE}\nTRADE SUMMARY REPORT\n{_RULE}\n\n"
+                f"Generated: {generated}\n\n"
+                f"{_SUMMARY_BODY.format_map(summary)}\n"
+                f"{_RULE}\n"
+            )
         
         print(f"Detailed report exported:")
         print(f"  - Trades: {csv_path}")
+        if parquet:
+            print(f"  - Trades (Parquet): {parquet_path}")
         print(f"  - Summary: {summary_path}")
 
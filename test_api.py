@@ -1,71 +1,42 @@
 """
 Test Binance API connection
 """
+import asyncio
 import os
 import sys
-from binance.client import Client
+from binance import AsyncClient
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-def test_api_connection():
-    """Test API connection based on trading mode"""
-    mode = os.getenv('TRADING_MODE', 'paper')
-    print("="*60)
-    print(f"Testing Binance API Connection - {mode.upper()} Mode")
-    print("="*60)
-    
-    if mode == 'backtest':
-        print("✓ Backtest mode - No API connection needed")
-        print("  Run: python run_backtest.py")
-        return True
-    
-    # Get API credentials based on mode
-    if mode == 'testnet':
-        api_key = os.getenv('BINANCE_TESTNET_API_KEY')
-        api_secret = os.getenv('BINANCE_TESTNET_API_SECRET')
-        testnet = True
-        print(f"Using Testnet API credentials")
-    else:  # paper or mainnet
-        api_key = os.getenv('BINANCE_API_KEY')
-        api_secret = os.getenv('BINANCE_API_SECRET')
-        testnet = False
-        print(f"Using Mainnet API credentials")
-    
-    # Check if credentials are set
-    if not api_key or not api_secret:
-        print("\n✗ API credentials not found!")
-        print("\nPlease set the following in your .env file:")
-        if mode == 'testnet':
-            print("  BINANCE_TESTNET_API_KEY=your_testnet_key")
-            print("  BINANCE_TESTNET_API_SECRET=your_testnet_secret")
-        else:
-            print("  BINANCE_API_KEY=your_api_key")
-            print("  BINANCE_API_SECRET=your_api_secret")
-        return False
-    
-    if api_key == 'your_mainnet_api_key_here' or api_key == 'your_testnet_api_key_here':
-        print("\n✗ Please replace placeholder API keys with real ones!")
-        print("  Edit .env file and add your actual API keys")
-        return False
+_HR60 = "=" * 60
+
+
+async def _run_probes(api_key: str, api_secret: str, testnet: bool, mode: str):
+    """
+    Run the API probes, reporting each step in order
     
-    print(f"API Key: {api_key[:8]}...{api_key[-4:]}")
-    print(f"Secret: {api_secret[:8]}...{api_secret[-4:]}")
+    Server time and account access run one after the other so the script
+    stops at the first failing step; the two public market data probes are
+    independent and are issued concurrently on the same AsyncClient.
     
-    # Test connection
+    Args:
+        api_key: Binance API key
+        api_secret: Binance API secret
+        testnet: Use the testnet endpoints
+        mode: Trading mode (for the balance hint)
+    """
+    client = await AsyncClient.create(api_key, api_secret, testnet=testnet)
     try:
-        print("\nConnecting to Binance API...")
-        client = Client(api_key, api_secret, testnet=testnet)
-        
         # Test 1: Server time
         print("\n1. Testing server time...")
-        server_time = client.get_server_time()
+        server_time = await client.get_server_time()
         print(f"   ✓ Server time: {server_time['serverTime']}")
         
         # Test 2: Account info
         print("\n2. Testing account access...")
-        account = client.get_account()
+        account = await client.get_account()
         print(f"   ✓ Account type: {account['accountType']}")
         print(f"   ✓ Can trade: {account['canTrade']}")
         print(f"   ✓ Can deposit: {account['canDeposit']}")
@@ -95,20 +66,72 @@ def test_api_connection():
                 print("   Note: Testnet accounts start with 0 balance")
                 print("   You may need to request test funds")
         
+        # Ticker and klines are independent public probes: fetch both at once
+        ticker, klines = await asyncio.gather(
+            client.get_symbol_ticker(symbol='BTCUSDT'),
+            client.get_klines(symbol='BTCUSDT', interval='1h', limit=5),
+        )
+        
         # Test 4: Market data
         print("\n4. Testing market data access...")
-        ticker = client.get_symbol_ticker(symbol='BTCUSDT')
         print(f"   ✓ BTC/USDT price: ${float(ticker['price']):,.2f}")
         
         # Test 5: Klines
         print("\n5. Testing historical data access...")
-        klines = client.get_klines(symbol='BTCUSDT', interval='1h', limit=5)
         print(f"   ✓ Retrieved {len(klines)} candles")
+    finally:
+        await client.close_connection()
+
+
+def test_api_connection():
+    """Test API connection based on trading mode"""
+    mode = os.getenv('TRADING_MODE', 'paper')
+    print(f"{_HR60}\nTesting Binance API Connection - {mode.upper()} Mode\n{_HR60}")
+    
+    if mode == 'backtest':
+        print("✓ Backtest mode - No API connection needed")
+        print("  Run: python run_backtest.py")
+        return True
+    
+    # Get API credentials based on mode
+    if mode == 'testnet':
+        api_key = os.getenv('BINANCE_TESTNET_API_KEY')
+        api_secret = os.getenv('BINANCE_TESTNET_API_SECRET')
+        testnet = True
+        print(f"Using Testnet API credentials")
+    else:  # paper or mainnet
+        api_key = os.getenv('BINANCE_API_KEY')
+        api_secret = os.getenv('BINANCE_API_SECRET')
+        testnet = False
+        print(f"Using Mainnet API credentials")
+    
+    # Check if credentials are set
+    if not api_key or not api_secret:
+        print("\n✗ API credentials not found!")
+        print("\nPlease set the following in your .env file:")
+        if mode == 'testnet':
+            print("  BINANCE_TESTNET_API_KEY=your_testnet_key")
+            print("  BINANCE_TESTNET_API_SECRET=your_testnet_secret")
+        else:
+            print("  BINANCE_API_KEY=your_api_key")
+            print("  BINANCE_API_SECRET=your_api_secret")
+        return False
+    
+    if api_key == 'your_mainnet_api_key_here' or api_key == 'your_testnet_api_key_here':
+        print("\n✗ Please replace placeholder API keys with real ones!")
+        print("  Edit .env file and add your actual API keys")
+        return False
+    
+    print(f"API Key: {api_key[:8]}...{api_key[-4:]}")
+    print(f"Secret: {api_secret[:8]}...{api_secret[-4:]}")
+    
+    # Test connection
+    try:
+        print("\nConnecting to Binance API...")
+        asyncio.run(_run_probes(api_key, api_secret, testnet, mode))
         
         # Summary
-        print("\n" + "="*60)
-        print("✓ ALL TESTS PASSED!")
-        print("="*60)
+        print(f"\n{_HR60}\n✓ ALL TESTS PASSED!\n{_HR60}")
         
         if mode == 'paper':
             print("\nYou're in PAPER mode - trades will be simulated")
@@ -125,9 +148,7 @@ def test_api_connection():
         return True
         
     except Exception as e:
-        print("\n" + "="*60)
-        print("✗ API CONNECTION FAILED!")
-        print("="*60)
+        print(f"\n{_HR60}\n✗ API CONNECTION FAILED!\n{_HR60}")
         print(f"\nError: {e}")
         
         # Common error messages
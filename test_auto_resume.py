@@ -7,60 +7,55 @@ This script tests the auto-resume functionality after hard stop.
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 
-def create_test_data():
-    """Create test data with a crash and recovery"""
+def create_test_data(rng=None):
+    """Create test data with a crash and recovery (rng: optional numpy Generator)"""
     
-    # Start date
-    start_date = datetime(2025, 1, 1)
+    if rng is None:
+        rng = np.random.default_rng()
+    
+    n = 1000
     
     # 1000 bars = ~16 hours at 1m
-    timestamps = [start_date + timedelta(minutes=i) for i in range(1000)]
+    timestamps = pd.date_range(datetime(2025, 1, 1), periods=n, freq='1min')
     
-    # Price simulation
-    prices = []
+    # Price simulation: a deterministic path per regime plus noise
     base_price = 250.0
+    path = np.full(n, base_price)
+    sigma = np.empty(n)
+    
+    # Normal trading
+    sigma[:200] = 2
+    
+    # Crash -6% (trigger hard stop at -5%)
+    crash_pct = (np.arange(200, 300) - 200) / 100 * 6
+    path[200:300] = base_price * (1 - crash_pct / 100)
+    sigma[200:300] = 1
+    
+    # Stay low (RSI oversold, but not recovering)
+    path[300:400] = base_price * 0.94
+    sigma[300:400] = 0.5
+    
+    # Start recovery (RSI improving, price recovering)
+    recovery_pct = (np.arange(400, 500) - 400) / 100 * 3
+    path[400:500] = base_price * 0.94 * (1 + recovery_pct / 100)
+    sigma[400:500] = 1
+    
+    # Back to normal
+    sigma[500:] = 2
     
-    for i in range(1000):
-        if i < 200:
-            # Normal trading
-            price = base_price + np.random.normal(0, 2)
-        elif i < 300:
-            # Crash -6% (trigger hard stop at -5%)
-            crash_pct = (i - 200) / 100 * 6
-            price = base_price * (1 - crash_pct / 100) + np.random.normal(0, 1)
-        elif i < 400:
-            # Stay low (RSI oversold, but not recovering)
-            price = base_price * 0.94 + np.random.normal(0, 0.5)
-        elif i < 500:
-            # Start recovery (RSI improving, price recovering)
-            recovery_pct = (i - 400) / 100 * 3
-            price = base_price * 0.94 * (1 + recovery_pct / 100) + np.random.normal(0, 1)
-        else:
-            # Back to normal
-            price = base_price + np.random.normal(0, 2)
-        
-        prices.append(max(price, 200))  # Floor at $200
+    prices = np.maximum(path + rng.normal(0, sigma), 200)  # Floor at $200
     
     # Create OHLCV data
-    data = []
-    for i, (ts, close) in enumerate(zip(timestamps, prices)):
-        high = close * (1 + abs(np.random.normal(0, 0.005)))
-        low = close * (1 - abs(np.random.normal(0, 0.005)))
-        open_price = close + np.random.normal(0, 0.5)
-        volume = np.random.uniform(1000, 10000)
-        
-        data.append({
-            'timestamp': ts,
-            'open': open_price,
-            'high': high,
-            'low': low,
-            'close': close,
-            'volume': volume
-        })
-    
-    df = pd.DataFrame(data)
+    df = pd.DataFrame({
+        'timestamp': timestamps,
+        'open': prices + rng.normal(0, 0.5, n),
+        'high': prices * (1 + np.abs(rng.normal(0, 0.005, n))),
+        'low': prices * (1 - np.abs(rng.normal(0, 0.005, n))),
+        'close': prices,
+        'volume': rng.uniform(1000, 10000, n)
+    })
     return df
 
 def main():
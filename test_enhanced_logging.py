@@ -16,11 +16,12 @@ from src.utils.console_logger import ConsoleLogger
 from src.utils.order_logger import OrderLogger
 
 
+_HR80 = "=" * 80
+
+
 def test_console_logger():
     """Test ConsoleLogger with various output types"""
-    print("\n" + "="*80)
-    print("TESTING ENHANCED CONSOLE LOGGER")
-    print("="*80 + "\n")
+    print(f"\n{_HR80}\nTESTING ENHANCED CONSOLE LOGGER\n{_HR80}\n")
     
     # Initialize logger
     logger = TradingLogger.get_logger('TestLogger')
@@ -154,24 +155,21 @@ def test_console_logger():
     console.print_error("Failed to connect to exchange API")
     console.print_info("Next trading loop in 60 seconds")
     
-    print("\n" + "="*80)
-    print("CONSOLE LOGGER TEST COMPLETED")
-    print("="*80 + "\n")
+    print(f"\n{_HR80}\nCONSOLE LOGGER TEST COMPLETED\n{_HR80}\n")
 
 
 def test_order_logger():
     """Test OrderLogger CSV tracking"""
-    print("\n" + "="*80)
-    print("TESTING ORDER LOGGER")
-    print("="*80 + "\n")
+    print(f"\n{_HR80}\nTESTING ORDER LOGGER\n{_HR80}\n")
     
     # Initialize order logger
     order_logger = OrderLogger(output_dir="./data/outputs/test")
     
-    print(f"Session ID: {order_logger.session_id}")
-    print(f"Orders file: {order_logger.orders_file}")
-    print(f"Fills file: {order_logger.fills_file}")
-    print()
+    print(
+        f"Session ID: {order_logger.session_id}\n"
+        f"Orders file: {order_logger.orders_file}\n"
+        f"Fills file: {order_logger.fills_file}\n"
+    )
     
     # Log some orders
     print("Logging sample orders...")
@@ -274,16 +272,12 @@ def test_order_logger():
     # Print summary
     order_logger.print_summary()
     
-    print("\n" + "="*80)
-    print("ORDER LOGGER TEST COMPLETED")
-    print("="*80 + "\n")
+    print(f"\n{_HR80}\nORDER LOGGER TEST COMPLETED\n{_HR80}\n")
 
 
 def test_combined_logging():
     """Test combined console and order logging"""
-    print("\n" + "="*80)
-    print("TESTING COMBINED LOGGING (Simulated Trading Loop)")
-    print("="*80 + "\n")
+    print(f"\n{_HR80}\nTESTING COMBINED LOGGING (Simulated Trading Loop)\n{_HR80}\n")
     
     # Initialize loggers
     logger = TradingLogger.get_logger('CombinedTest')
@@ -317,40 +311,41 @@ def test_combined_logging():
     console.print_pnl_state("RUN", daily_pnl=1.8, gap_pnl=0.5)
     
     # Place orders
-    orders = [
-        {"type": "GRID", "side": "BUY", "price": 67700.00, "qty": 0.0147, "tag": "grid_buy_1"},
-        {"type": "GRID", "side": "BUY", "price": 67500.00, "qty": 0.0147, "tag": "grid_buy_2"},
-        {"type": "GRID", "side": "SELL", "price": 68100.00, "qty": 0.0147, "tag": "grid_sell_1"},
-        {"type": "DCA", "side": "BUY", "price": 66900.00, "qty": 0.0294, "tag": "dca_oversold"},
-        {"type": "TP", "side": "SELL", "price": 69200.00, "qty": 0.0588, "tag": "tp_overbought"},
-    ]
-    
-    for i, order in enumerate(orders):
+    # (type, side, price, qty, tag)
+    orders = (
+        ("GRID", "BUY", 67700.00, 0.0147, "grid_buy_1"),
+        ("GRID", "BUY", 67500.00, 0.0147, "grid_buy_2"),
+        ("GRID", "SELL", 68100.00, 0.0147, "grid_sell_1"),
+        ("DCA", "BUY", 66900.00, 0.0294, "dca_oversold"),
+        ("TP", "SELL", 69200.00, 0.0588, "tp_overbought"),
+    )
+    
+    for i, (otype, side, price, qty, tag) in enumerate(orders):
         order_id = f"ORD_{order_logger.session_id}_{i}"
         
         # Console log
         console.print_order_placed(
-            order_type=order["type"],
-            side=order["side"],
+            order_type=otype,
+            side=side,
             symbol="BTCUSDT",
-            qty=order["qty"],
-            price=order["price"],
-            tag=order["tag"],
+            qty=qty,
+            price=price,
+            tag=tag,
             order_id=order_id
         )
         
         # CSV log
         order_logger.log_order(
             symbol="BTCUSDT",
-            order_type=order["side"],
+            order_type=side,
             side="LONG",
-            action="OPEN" if order["side"] == "BUY" else "CLOSE",
-            price=order["price"],
-            quantity=order["qty"],
+            action="OPEN" if side == "BUY" else "CLOSE",
+            price=price,
+            quantity=qty,
             status="NEW",
             strategy="Hybrid",
-            tag=order["tag"],
-            reason=order["type"],
+            tag=tag,
+            reason=otype,
             mode="paper",
             order_id=order_id
         )
@@ -367,9 +362,7 @@ def test_combined_logging():
     
     console.print_success("Trading loop completed successfully")
     
-    print("\n" + "="*80)
-    print("COMBINED LOGGING TEST COMPLETED")
-    print("="*80 + "\n")
+    print(f"\n{_HR80}\nCOMBINED LOGGING TEST COMPLETED\n{_HR80}\n")
 
 
 if __name__ == '__main__':
@@ -378,11 +371,10 @@ if __name__ == '__main__':
     test_order_logger()
     test_combined_logging()
     
-    print("\n" + "="*80)
-    print("ALL TESTS COMPLETED")
-    print("="*80 + "\n")
-    print("Check the following for output:")
-    print("  - Console: Colored output above")
-    print("  - CSV files: ./data/outputs/test/")
-    print()
+    print(f"\n{_HR80}\nALL TESTS COMPLETED\n{_HR80}\n")
+    print(
+        "Check the following for output:\n"
+        "  - Console: Colored output above\n"
+        "  - CSV files: ./data/outputs/test/\n"
+    )
 
@@ -1,18 +1,27 @@
 """
 Test script for Hybrid Strategy Engine (Option-A)
 """
+import io
+import os
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from datetime import datetime
 import yaml
+from functools import lru_cache
 
 from src.strategies.hybrid_strategy_engine import HybridStrategyEngine
 from src.indicators.indicator_engine import IndicatorEngine
 from src.indicators.technical import add_all_indicators
 
 
+_HR70 = "=" * 70
+
+
+@lru_cache(maxsize=1)
 def load_config():
-    """Load hybrid strategy configuration"""
+    """Load hybrid strategy configuration (read once, shared by all tests)"""
     with open('config/config.yaml', 'r') as f:
         config = yaml.safe_load(f)
     return config
@@ -20,23 +29,23 @@ def load_config():
 
 def generate_sample_data(scenario='normal'):
     """Generate sample OHLCV data for testing"""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     periods = 200
     base_price = 50000.0
     
-    dates = [datetime.now() - timedelta(minutes=i) for i in range(periods)]
-    dates.reverse()
-    
-    prices = [base_price]
+    dates = pd.date_range(end=datetime.now(), periods=periods, freq='1min')
     
     # Different scenarios
     if scenario == 'oversold':
-        # Declining market → RSI will be low
-        trend = -0.002
+        # Declining market → RSI will be low (drift well above the noise so
+        # the last bars reliably end below the DCA threshold)
+        trend = -0.003
+        volatility = 0.005
     elif scenario == 'overbought':
-        # Rising market → RSI will be high
-        trend = 0.002
+        # Rising market → RSI will be high (above the TP threshold)
+        trend = 0.003
+        volatility = 0.005
     elif scenario == 'volatile':
         # High volatility
         trend = 0
@@ -46,68 +55,70 @@ def generate_sample_data(scenario='normal'):
         trend = 0
         volatility = 0.01
     
-    for i in range(1, periods):
-        if scenario == 'volatile':
-            change = np.random.normal(trend, volatility)
-        else:
-            volatility = 0.01
-            change = np.random.normal(trend, volatility)
-        
-        new_price = prices[-1] * (1 + change)
-        prices.append(new_price)
+    # Random walk: compound all bar-to-bar changes at once
+    changes = rng.normal(trend, volatility, periods - 1)
+    prices = base_price * np.concatenate(([1.0], np.cumprod(1 + changes)))
     
     # Generate OHLCV
-    data = []
-    for i, (date, close) in enumerate(zip(dates, prices)):
-        volatility_intra = 0.001
-        high = close * (1 + abs(np.random.normal(0, volatility_intra)))
-        low = close * (1 - abs(np.random.normal(0, volatility_intra)))
-        open_price = (high + low) / 2
-        volume = np.random.uniform(1000, 5000)
-        
-        data.append({
-            'timestamp': date,
-            'open': open_price,
-            'high': high,
-            'low': low,
-            'close': close,
-            'volume': volume
-        })
-    
-    df = pd.DataFrame(data)
+    volatility_intra = 0.001
+    high = prices * (1 + np.abs(rng.normal(0, volatility_intra, periods)))
+    low = prices * (1 - np.abs(rng.normal(0, volatility_intra, periods)))
+    
+    df = pd.DataFrame({
+        'timestamp': dates,
+        'open': (high + low) / 2,
+        'high': high,
+        'low': low,
+        'close': prices,
+        'volume': rng.uniform(1000, 5000, periods)
+    })
     return df
 
 
+BAR_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+
+def bar_at(df, i=-1):
+    """OHLCV bar dict for row i, from a single row lookup"""
+    return df.iloc[i][BAR_COLUMNS].to_dict()
+
+
+@lru_cache(maxsize=None)
+def _scenario_with_indicators(scenario):
+    """Sample data for a scenario with indicators added, computed once"""
+    return add_all_indicators(generate_sample_data(scenario))
+
+
+def load_scenario(scenario='normal'):
+    """Copy of the cached scenario data with indicators (safe to modify)"""
+    return _scenario_with_indicators(scenario).copy()
+
+
+@lru_cache(maxsize=None)
+def scenario_engine(scenario='normal'):
+    """IndicatorEngine over the cached scenario data, built once per scenario"""
+    return IndicatorEngine.from_frame('BTCUSDT', load_scenario(scenario))
+
+
 def test_basic_functionality():
     """Test basic functionality of Hybrid Strategy Engine"""
     
-    print("\n" + "="*70)
-    print("TEST 1: BASIC FUNCTIONALITY")
-    print("="*70 + "\n")
+    print(f"\n{_HR70}\nTEST 1: BASIC FUNCTIONALITY\n{_HR70}\n")
     
     # Load config
     config = load_config()
     policy_cfg = config['default_policy']
     
     # Generate data
-    df = generate_sample_data('normal')
-    df = add_all_indicators(df)
+    df = load_scenario('normal')
     
     # Initialize engines
-    indicator_engine = IndicatorEngine('BTCUSDT')
-    indicator_engine.update(df)
+    indicator_engine = scenario_engine('normal')
     
     strategy_engine = HybridStrategyEngine('BTCUSDT', policy_cfg, indicator_engine)
     
     # Get latest bar
-    latest_bar = {
-        'timestamp': df.iloc[-1]['timestamp'],
-        'open': df.iloc[-1]['open'],
-        'high': df.iloc[-1]['high'],
-        'low': df.iloc[-1]['low'],
-        'close': df.iloc[-1]['close'],
-        'volume': df.iloc[-1]['volume']
-    }
+    latest_bar = bar_at(df)
     
     equity = 10000.0
     
@@ -137,21 +148,17 @@ def test_basic_functionality():
 def test_oversold_scenario():
     """Test DCA triggering in oversold scenario"""
     
-    print("\n" + "="*70)
-    print("TEST 2: OVERSOLD SCENARIO (DCA TRIGGER)")
-    print("="*70 + "\n")
+    print(f"\n{_HR70}\nTEST 2: OVERSOLD SCENARIO (DCA TRIGGER)\n{_HR70}\n")
     
     # Load config
     config = load_config()
     policy_cfg = config['default_policy']
     
     # Generate oversold data
-    df = generate_sample_data('oversold')
-    df = add_all_indicators(df)
+    df = load_scenario('oversold')
     
     # Initialize engines
-    indicator_engine = IndicatorEngine('BTCUSDT')
-    indicator_engine.update(df)
+    indicator_engine = scenario_engine('oversold')
     
     strategy_engine = HybridStrategyEngine('BTCUSDT', policy_cfg, indicator_engine)
     
@@ -164,14 +171,7 @@ def test_oversold_scenario():
     print(f"  ATR%: {signals['atr_pct']:.3f}%")
     
     # Get latest bar
-    latest_bar = {
-        'timestamp': df.iloc[-1]['timestamp'],
-        'open': df.iloc[-1]['open'],
-        'high': df.iloc[-1]['high'],
-        'low': df.iloc[-1]['low'],
-        'close': df.iloc[-1]['close'],
-        'volume': df.iloc[-1]['volume']
-    }
+    latest_bar = bar_at(df)
     
     equity = 10000.0
     
@@ -188,27 +188,25 @@ def test_oversold_scenario():
     else:
         print(f"  ✗ DCA not triggered")
     
+    assert plan['dca_orders'], f"DCA not triggered at RSI {signals['rsi']:.1f}"
+    
     print("\n✓ Oversold scenario test passed")
 
 
 def test_overbought_scenario():
     """Test TP triggering in overbought scenario"""
     
-    print("\n" + "="*70)
-    print("TEST 3: OVERBOUGHT SCENARIO (TP TRIGGER)")
-    print("="*70 + "\n")
+    print(f"\n{_HR70}\nTEST 3: OVERBOUGHT SCENARIO (TP TRIGGER)\n{_HR70}\n")
     
     # Load config
     config = load_config()
     policy_cfg = config['default_policy']
     
     # Generate overbought data
-    df = generate_sample_data('overbought')
-    df = add_all_indicators(df)
+    df = load_scenario('overbought')
     
     # Initialize engines
-    indicator_engine = IndicatorEngine('BTCUSDT')
-    indicator_engine.update(df)
+    indicator_engine = scenario_engine('overbought')
     
     strategy_engine = HybridStrategyEngine('BTCUSDT', policy_cfg, indicator_engine)
     
@@ -221,14 +219,7 @@ def test_overbought_scenario():
     print(f"  ATR%: {signals['atr_pct']:.3f}%")
     
     # Get latest bar
-    latest_bar = {
-        'timestamp': df.iloc[-1]['timestamp'],
-        'open': df.iloc[-1]['open'],
-        'high': df.iloc[-1]['high'],
-        'low': df.iloc[-1]['low'],
-        'close': df.iloc[-1]['close'],
-        'volume': df.iloc[-1]['volume']
-    }
+    latest_bar = bar_at(df)
     
     equity = 10000.0
     
@@ -245,39 +236,30 @@ def test_overbought_scenario():
     else:
         print(f"  ✗ TP not triggered")
     
+    assert plan['tp_orders'], f"TP not triggered at RSI {signals['rsi']:.1f}"
+    
     print("\n✓ Overbought scenario test passed")
 
 
 def test_pnl_gate():
     """Test PnL Gate state transitions"""
     
-    print("\n" + "="*70)
-    print("TEST 4: PNL GATE STATE TRANSITIONS")
-    print("="*70 + "\n")
+    print(f"\n{_HR70}\nTEST 4: PNL GATE STATE TRANSITIONS\n{_HR70}\n")
     
     # Load config
     config = load_config()
     policy_cfg = config['default_policy']
     
     # Generate data
-    df = generate_sample_data('normal')
-    df = add_all_indicators(df)
+    df = load_scenario('normal')
     
     # Initialize engines
-    indicator_engine = IndicatorEngine('BTCUSDT')
-    indicator_engine.update(df)
+    indicator_engine = scenario_engine('normal')
     
     strategy_engine = HybridStrategyEngine('BTCUSDT', policy_cfg, indicator_engine)
     
     # Get latest bar
-    latest_bar = {
-        'timestamp': df.iloc[-1]['timestamp'],
-        'open': df.iloc[-1]['open'],
-        'high': df.iloc[-1]['high'],
-        'low': df.iloc[-1]['low'],
-        'close': df.iloc[-1]['close'],
-        'volume': df.iloc[-1]['volume']
-    }
+    latest_bar = bar_at(df)
     
     # Test different equity scenarios
     scenarios = [
@@ -306,9 +288,7 @@ def test_pnl_gate():
 def test_dynamic_spread():
     """Test dynamic spread calculation"""
     
-    print("\n" + "="*70)
-    print("TEST 5: DYNAMIC SPREAD CALCULATION")
-    print("="*70 + "\n")
+    print(f"\n{_HR70}\nTEST 5: DYNAMIC SPREAD CALCULATION\n{_HR70}\n")
     
     # Load config
     config = load_config()
@@ -320,24 +300,15 @@ def test_dynamic_spread():
     ]
     
     for scenario_name, data_type in scenarios:
-        df = generate_sample_data(data_type)
-        df = add_all_indicators(df)
+        df = load_scenario(data_type)
         
-        indicator_engine = IndicatorEngine('BTCUSDT')
-        indicator_engine.update(df)
+        indicator_engine = scenario_engine(data_type)
         
         strategy_engine = HybridStrategyEngine('BTCUSDT', policy_cfg, indicator_engine)
         
         signals = indicator_engine.latest()
         
-        latest_bar = {
-            'timestamp': df.iloc[-1]['timestamp'],
-            'open': df.iloc[-1]['open'],
-            'high': df.iloc[-1]['high'],
-            'low': df.iloc[-1]['low'],
-            'close': df.iloc[-1]['close'],
-            'volume': df.iloc[-1]['volume']
-        }
+        latest_bar = bar_at(df)
         
         plan = strategy_engine.on_bar(latest_bar, 10000.0)
         
@@ -354,31 +325,20 @@ def test_dynamic_spread():
 def test_kill_replace():
     """Test grid kill_replace logic"""
     
-    print("\n" + "="*70)
-    print("TEST 6: GRID KILL_REPLACE LOGIC")
-    print("="*70 + "\n")
+    print(f"\n{_HR70}\nTEST 6: GRID KILL_REPLACE LOGIC\n{_HR70}\n")
     
     # Load config
     config = load_config()
     policy_cfg = config['default_policy']
     
-    df = generate_sample_data('normal')
-    df = add_all_indicators(df)
+    df = load_scenario('normal')
     
-    indicator_engine = IndicatorEngine('BTCUSDT')
-    indicator_engine.update(df)
+    indicator_engine = scenario_engine('normal')
     
     strategy_engine = HybridStrategyEngine('BTCUSDT', policy_cfg, indicator_engine)
     
     # First call - establish grid
-    bar1 = {
-        'timestamp': df.iloc[-10]['timestamp'],
-        'open': df.iloc[-10]['open'],
-        'high': df.iloc[-10]['high'],
-        'low': df.iloc[-10]['low'],
-        'close': df.iloc[-10]['close'],
-        'volume': df.iloc[-10]['volume']
-    }
+    bar1 = bar_at(df, -10)
     
     plan1 = strategy_engine.on_bar(bar1, 10000.0)
     print(f"First Grid:")
@@ -387,14 +347,8 @@ def test_kill_replace():
     print(f"  Grid Orders: {len(plan1['grid_orders'])}")
     
     # Second call - price drifted significantly
-    bar2 = {
-        'timestamp': df.iloc[-1]['timestamp'],
-        'open': df.iloc[-1]['open'],
-        'high': df.iloc[-1]['high'],
-        'low': df.iloc[-1]['low'],
-        'close': df.iloc[-1]['close'] * 1.015,  # +1.5% drift
-        'volume': df.iloc[-1]['volume']
-    }
+    bar2 = bar_at(df)
+    bar2['close'] *= 1.015  # +1.5% drift
     
     plan2 = strategy_engine.on_bar(bar2, 10000.0)
     print(f"\nSecond Grid (after price drift):")
@@ -409,22 +363,54 @@ def test_kill_replace():
     print("\n✓ Kill_replace test passed")
 
 
+SCENARIO_TESTS = (
+    test_basic_functionality,
+    test_oversold_scenario,
+    test_overbought_scenario,
+    test_pnl_gate,
+    test_dynamic_spread,
+    test_kill_replace,
+)
+
+
+def run_scenario(test):
+    """
+    Run one scenario test in a worker process
+    
+    Args:
+        test: Test function to run
+        
+    Returns:
+        Captured stdout and stderr (engine log lines) of the test, in the
+        order written, so each scenario's report prints as one block
+        
+    Raises:
+        Whatever the test raises, with the captured output attached as
+        ``scenario_output`` so the failing report can still be printed
+    """
+    buf = io.StringIO()
+    try:
+        # Unconfigured loggers fall back to sys.stderr, so this also
+        # captures the engine's warnings instead of interleaving them
+        with redirect_stdout(buf), redirect_stderr(buf):
+            test()
+    except BaseException as e:
+        e.scenario_output = buf.getvalue()
+        raise
+    return buf.getvalue()
+
+
 if __name__ == '__main__':
-    print("\n" + "="*70)
-    print("HYBRID STRATEGY ENGINE TEST SUITE")
-    print("="*70)
+    print(f"\n{_HR70}\nHYBRID STRATEGY ENGINE TEST SUITE\n{_HR70}")
     
     try:
-        test_basic_functionality()
-        test_oversold_scenario()
-        test_overbought_scenario()
-        test_pnl_gate()
-        test_dynamic_spread()
-        test_kill_replace()
+        # Scenarios are independent and CPU-bound: run them in parallel
+        workers = min(len(SCENARIO_TESTS), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            for output in ex.map(run_scenario, SCENARIO_TESTS):
+                print(output, end='')
         
-        print("\n" + "="*70)
-        print("✅ ALL TESTS PASSED")
-        print("="*70 + "\n")
+        print(f"\n{_HR70}\n✅ ALL TESTS PASSED\n{_HR70}\n")
         
         print("Summary:")
         print("  ✓ Basic functionality")
@@ -436,6 +422,8 @@ if __name__ == '__main__':
         print("\nHybrid Strategy Engine is ready for production! 🚀")
     
     except Exception as e:
+        # Progress output of the failing scenario, captured in its worker
+        print(getattr(e, 'scenario_output', ''), end='')
         print(f"\n❌ TEST FAILED: {e}")
         import traceback
         traceback.print_exc()